@@ -0,0 +1,33 @@
+"""Add owner index to farms table
+
+Revision ID: 5e2a9c1f83d7
+Revises: 7c5d506866b2
+Create Date: 2026-10-16 11:20:08.914372
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e2a9c1f83d7'
+down_revision: Union[str, Sequence[str], None] = '7c5d506866b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index farms by owner and restore the spatial indexes."""
+    # area_sqm is included so per-owner area sums are answered from the index
+    op.create_index('idx_farms_owner_id', 'farms', ['owner_id'], unique=False, postgresql_include=['area_sqm'])
+
+    # b159ff1544cc dropped these; bbox, radius and intersection searches rely on them
+    op.create_index('idx_farms_boundary', 'farms', ['boundary'], unique=False, postgresql_using='gist', if_not_exists=True)
+    op.create_index('idx_farms_centroid', 'farms', ['centroid'], unique=False, postgresql_using='gist', if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Drop farm owner index."""
+    op.drop_index('idx_farms_owner_id', table_name='farms')
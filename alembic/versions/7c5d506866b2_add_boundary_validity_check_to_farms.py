@@ -0,0 +1,32 @@
+"""Add boundary validity check to farms table
+
+Revision ID: 7c5d506866b2
+Revises: d4b878c102f4
+Create Date: 2026-10-16 10:04:27.551893
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c5d506866b2'
+down_revision: Union[str, Sequence[str], None] = 'd4b878c102f4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Reject invalid farm boundaries on write."""
+    # NOT VALID: enforce for new writes without failing on legacy rows
+    op.execute(
+        "ALTER TABLE farms ADD CONSTRAINT ck_farm_boundary_valid "
+        "CHECK (ST_IsValid(boundary::geometry)) NOT VALID"
+    )
+
+
+def downgrade() -> None:
+    """Drop farm boundary validity check."""
+    op.drop_constraint('ck_farm_boundary_valid', 'farms', type_='check')
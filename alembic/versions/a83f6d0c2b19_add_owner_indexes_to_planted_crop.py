@@ -0,0 +1,30 @@
+"""Add owner indexes to planted_crop table
+
+Revision ID: a83f6d0c2b19
+Revises: 5e2a9c1f83d7
+Create Date: 2026-10-16 12:02:51.406227
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a83f6d0c2b19'
+down_revision: Union[str, Sequence[str], None] = '5e2a9c1f83d7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index planted crops by owner for listing and plot filtering."""
+    op.create_index('idx_planted_crop_user_created', 'planted_crop', ['user_id', sa.text('created_at DESC')], unique=False)
+    op.create_index('idx_planted_crop_user_plot', 'planted_crop', ['user_id', 'plot_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Drop planted_crop owner indexes."""
+    op.drop_index('idx_planted_crop_user_plot', table_name='planted_crop')
+    op.drop_index('idx_planted_crop_user_created', table_name='planted_crop')
@@ -0,0 +1,52 @@
+"""Add lookup indexes to plots and plot type tables
+
+Revision ID: b3d5e8f1a047
+Revises: e61b7f4a9d25
+Create Date: 2026-10-16 14:02:51.207336
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3d5e8f1a047'
+down_revision: Union[str, Sequence[str], None] = 'e61b7f4a9d25'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+PLOT_TYPE_TABLES = [
+    'field_plot_types',
+    'barn_plot_types',
+    'pasture_plot_types',
+    'greenhouse_plot_types',
+    'chicken_pen_plot_types',
+    'cow_shed_plot_types',
+    'fish_pond_plot_types',
+    'residence_plot_types',
+    'natural_area_plot_types',
+    'water_source_plot_types',
+]
+
+
+def upgrade() -> None:
+    """Index plots by farm and type, plot type rows by plot, and restore spatial indexes."""
+    op.create_index('idx_plots_farm_id_plot_type', 'plots', ['farm_id', 'plot_type'], unique=False)
+
+    # b159ff1544cc dropped these alongside the farm ones
+    op.create_index('idx_plots_boundary', 'plots', ['boundary'], unique=False, postgresql_using='gist', if_not_exists=True)
+    op.create_index('idx_plots_centroid', 'plots', ['centroid'], unique=False, postgresql_using='gist', if_not_exists=True)
+
+    for table in PLOT_TYPE_TABLES:
+        op.create_index(op.f(f'ix_{table}_plot_id'), table, ['plot_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Drop plot lookup indexes."""
+    for table in PLOT_TYPE_TABLES:
+        op.drop_index(op.f(f'ix_{table}_plot_id'), table_name=table)
+
+    op.drop_index('idx_plots_farm_id_plot_type', table_name='plots')
@@ -0,0 +1,54 @@
+"""Add geojson columns to farms table
+
+Revision ID: d4b878c102f4
+Revises: 37a9fcd39324
+Create Date: 2026-10-16 09:12:41.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4b878c102f4'
+down_revision: Union[str, Sequence[str], None] = '37a9fcd39324'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add boundary/centroid geojson columns maintained by a trigger."""
+    op.add_column('farms', sa.Column('boundary_geojson', postgresql.JSONB(), nullable=True))
+    op.add_column('farms', sa.Column('centroid_geojson', postgresql.JSONB(), nullable=True))
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION farms_sync_geojson() RETURNS trigger AS $$
+        BEGIN
+            NEW.boundary_geojson := ST_AsGeoJSON(NEW.boundary)::jsonb;
+            NEW.centroid_geojson := ST_AsGeoJSON(NEW.centroid)::jsonb;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER farms_sync_geojson
+        BEFORE INSERT OR UPDATE OF boundary, centroid ON farms
+        FOR EACH ROW EXECUTE FUNCTION farms_sync_geojson()
+    """)
+
+    op.execute("""
+        UPDATE farms
+        SET boundary_geojson = ST_AsGeoJSON(boundary)::jsonb,
+            centroid_geojson = ST_AsGeoJSON(centroid)::jsonb
+    """)
+
+
+def downgrade() -> None:
+    """Remove geojson columns and their trigger from farms table."""
+    op.execute("DROP TRIGGER IF EXISTS farms_sync_geojson ON farms")
+    op.execute("DROP FUNCTION IF EXISTS farms_sync_geojson()")
+    op.drop_column('farms', 'centroid_geojson')
+    op.drop_column('farms', 'boundary_geojson')
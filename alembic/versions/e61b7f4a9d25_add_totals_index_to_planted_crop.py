@@ -0,0 +1,28 @@
+"""Add totals index to planted_crop table
+
+Revision ID: e61b7f4a9d25
+Revises: a83f6d0c2b19
+Create Date: 2026-10-16 12:48:13.220764
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e61b7f4a9d25'
+down_revision: Union[str, Sequence[str], None] = 'a83f6d0c2b19'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Cover per-owner yield and plant totals."""
+    op.create_index('idx_planted_crop_user_totals', 'planted_crop', ['user_id'], unique=False, postgresql_include=['estimated_yield', 'number_of_crops'])
+
+
+def downgrade() -> None:
+    """Drop planted_crop totals index."""
+    op.drop_index('idx_planted_crop_user_totals', table_name='planted_crop')
@@ -0,0 +1,38 @@
+"""Generate plot area from boundary
+
+Revision ID: f2c7a4d90e36
+Revises: b3d5e8f1a047
+Create Date: 2026-10-16 15:21:08.493172
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2c7a4d90e36'
+down_revision: Union[str, Sequence[str], None] = 'b3d5e8f1a047'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Replace plots.area_sqm with a stored column generated from boundary."""
+    # An existing column cannot be turned into a generated one, so add the
+    # generated column alongside and swap names
+    op.add_column('plots', sa.Column(
+        'area_sqm_generated', sa.Float(),
+        sa.Computed('ST_Area(boundary)', persisted=True), nullable=True
+    ))
+    op.drop_column('plots', 'area_sqm')
+    op.alter_column('plots', 'area_sqm_generated', new_column_name='area_sqm')
+
+
+def downgrade() -> None:
+    """Restore plots.area_sqm as a plain column holding the current areas."""
+    op.add_column('plots', sa.Column('area_sqm_plain', sa.Float(), nullable=True))
+    op.execute("UPDATE plots SET area_sqm_plain = area_sqm")
+    op.drop_column('plots', 'area_sqm')
+    op.alter_column('plots', 'area_sqm_plain', new_column_name='area_sqm')
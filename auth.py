@@ -2,8 +2,17 @@ import datetime
 import os
 import base64
 import json
+import time
+from collections import OrderedDict
 import jwt
 
+# Decoded tokens keyed by the raw token string, so repeat requests with the
+# same bearer token skip signature verification. Entries live at most
+# JWT_CACHE_TTL seconds and never past the token's own exp claim.
+JWT_CACHE_SIZE = 4096
+JWT_CACHE_TTL = 60
+_decoded_jwt_cache = OrderedDict()
+
 
 def create_JWT(user):
     payload = {
@@ -30,6 +39,28 @@ def decodeJWT(jwt_encoded, use_google_secret=False):
     return ans
 
 
+def decodeJWT_cached(jwt_encoded):
+    """decodeJWT with a small LRU/TTL cache; "Invalid" results are cached too"""
+    now = time.time()
+    cached = _decoded_jwt_cache.get(jwt_encoded)
+    if cached is not None:
+        expires_at, ans = cached
+        if expires_at > now:
+            _decoded_jwt_cache.move_to_end(jwt_encoded)
+            return ans
+        del _decoded_jwt_cache[jwt_encoded]
+
+    ans = decodeJWT(jwt_encoded)
+    expires_at = now + JWT_CACHE_TTL
+    if ans != "Invalid":
+        expires_at = min(expires_at, ans.get('exp', expires_at))
+
+    _decoded_jwt_cache[jwt_encoded] = (expires_at, ans)
+    if len(_decoded_jwt_cache) > JWT_CACHE_SIZE:
+        _decoded_jwt_cache.popitem(last=False)
+    return ans
+
+
 def decode_google_jwt(token: str) -> dict:
     parts = token.split(".")
     if len(parts) != 3:
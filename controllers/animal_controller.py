@@ -4,7 +4,7 @@ from datetime import date, datetime
 from sqlalchemy import func, select, and_, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
-from aiocache import Cache, cached
+from aiocache import Cache
 
 from models.animal import Animal
 from models.animal_type import AnimalType
@@ -236,7 +236,7 @@ async def get_animal(
         }
 
 
-@cached(cache=Cache.REDIS, ttl=600,
+@grouped_cached(cache=Cache.REDIS, ttl=600,
     key_builder=lambda f, session, user_uuid, skip=0, limit=100, farm_id=None, animal_type_id=None, is_active=None:
     gen_user_key(user_uuid, "animals", "list",
                   gen_query_hash({"skip": skip, "limit": limit, "farm_id": farm_id,
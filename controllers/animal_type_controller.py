@@ -3,7 +3,7 @@ import hashlib
 
 from sqlalchemy import func, select, or_
 from sqlalchemy.ext.asyncio import AsyncSession
-from aiocache import Cache, cached
+from aiocache import Cache
 
 from models.animal_type import AnimalType, AnimalSex, AnimalCategory
 from services.caching import *
@@ -122,7 +122,7 @@ async def get_animal_type(
         }
 
 
-@cached(cache=Cache.REDIS, ttl=86400,
+@grouped_cached(cache=Cache.REDIS, ttl=86400,
     key_builder=lambda f, session, skip=0, limit=100, category=None, sex=None:
     gen_user_key("system", "animal_types", "list",
                   gen_query_hash({"skip": skip, "limit": limit, "category": category, "sex": sex}))
@@ -329,7 +329,7 @@ async def delete_animal_type(
         }
 
 
-@cached(cache=Cache.REDIS, ttl=3600,
+@grouped_cached(cache=Cache.REDIS, ttl=3600,
     key_builder=lambda f, session, search_term:
     gen_user_key("system", "animal_types", "search", hashlib.md5(search_term.encode()).hexdigest()[:8])
 )
@@ -6,7 +6,7 @@ from pathlib import Path
 
 from sqlalchemy import func, select, or_
 from sqlalchemy.ext.asyncio import AsyncSession
-from aiocache import Cache, cached
+from aiocache import Cache
 
 from models.crop import Crop, CropGroup, Lifecycle, SeedlingType
 from services.caching import *
@@ -137,7 +137,7 @@ async def get_crop(
         }
 
 
-@cached(cache=Cache.REDIS, ttl=86400,
+@grouped_cached(cache=Cache.REDIS, ttl=86400,
     key_builder=lambda f, session, skip=0, limit=100, crop_group=None, lifecycle=None:
     gen_user_key("system", "crops", "list",
                   gen_query_hash({"skip": skip, "limit": limit, "crop_group": crop_group, "lifecycle": lifecycle}))
@@ -352,7 +352,7 @@ async def delete_crop(
         }
 
 
-@cached(cache=Cache.REDIS, ttl=3600,
+@grouped_cached(cache=Cache.REDIS, ttl=3600,
     key_builder=lambda f, session, search_term:
     gen_user_key("system", "crops", "search", hashlib.md5(search_term.encode()).hexdigest()[:8])
 )
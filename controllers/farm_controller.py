@@ -1,15 +1,64 @@
 import json
-from os import supports_dir_fd
-from typing import Optional, Dict, Any
+from datetime import datetime
+from typing import Optional, Dict, Any, List, AsyncIterator
 
-from shapely.geometry import shape, Polygon
-from sqlalchemy import func, select
+from geoalchemy2 import Geography, Geometry
+from shapely.geometry import shape
+from sqlalchemy import Text, bindparam, cast, func, insert, lambda_stmt, literal_column, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from aiocache import Cache, cached
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import undefer, undefer_group
+from aiocache import Cache
 
 from models.farm import Farm
 from services.caching import *
 
+WGS84_GEOGRAPHY = Geography(srid=4326)
+WGS84_GEOMETRY = Geometry(srid=4326)
+
+FARM_GEOMETRY_MODES = ("boundary", "centroid")
+
+# Hot fixed-shape statements are built once; lambda_stmt caches their cache
+# key by code location so per-call construction and traversal are skipped.
+FARM_BY_UUID = lambda_stmt(
+    lambda: select(Farm).filter(Farm.uuid == bindparam('farm_id'))
+)
+FARM_WITH_GEOJSON_BY_UUID = lambda_stmt(
+    lambda: select(Farm)
+    .options(undefer_group('geojson'))
+    .filter(Farm.uuid == bindparam('farm_id'))
+)
+TOTAL_AREA_BY_OWNER = lambda_stmt(
+    lambda: select(func.sum(Farm.area_sqm)).filter(Farm.owner_id == bindparam('owner_id'))
+)
+COUNT_FARMS_BY_OWNER = lambda_stmt(
+    lambda: select(func.count(Farm.id)).filter(Farm.owner_id == bindparam('owner_id'))
+)
+
+
+def geojson_to_geometry(geojson: Dict[str, Any]):
+    """Build a PostGIS geometry (SRID 4326) directly from a GeoJSON dict"""
+    return func.ST_SetSRID(func.ST_GeomFromGeoJSON(json.dumps(geojson)), 4326)
+
+
+def farm_feature(source):
+    """Build a farm GeoJSON Feature as jsonb from Farm or a subquery's columns"""
+    return func.jsonb_build_object(
+        'type', 'Feature',
+        'id', source.uuid,
+        'geometry', source.boundary_geojson,
+        'properties', func.jsonb_build_object(
+            'uuid', source.uuid,
+            'name', source.name,
+            'description', source.description,
+            'area_sqm', source.area_sqm,
+            'centroid', source.centroid_geojson,
+            'created_at', source.created_at,
+            'updated_at', source.updated_at
+        )
+    )
+
+
 async def create_farm(
         session: AsyncSession,
         data: Dict[str, Any],
@@ -21,37 +70,29 @@ async def create_farm(
         owner_id = user["uuid"]
         boundary_geojson = data["geojson"]
 
-        boundary_shape = shape(boundary_geojson)
-
-        if not isinstance(boundary_shape, Polygon):
+        if boundary_geojson.get("type") != "Polygon":
             return {
                 "status": "error",
                 "message": "Invalid shape",
             }
 
-        centroid = boundary_shape.centroid
-
-        farm = Farm(
-            name=name,
-            owner_id=owner_id,
-            description=description
-        )
-
-        farm.boundary = func.ST_GeomFromText(boundary_shape.wkt, 4326)
-        farm.centroid = func.ST_GeomFromText(centroid.wkt, 4326)
-
-        session.add(farm)
-        await session.flush()
-
-        area_result = await session.execute(
-            select(func.ST_Area(Farm.boundary)).filter(Farm.id == farm.id)
+        boundary = geojson_to_geometry(boundary_geojson)
+
+        # Area is computed inside the INSERT and the stored row comes back
+        # through RETURNING, so the farm never has to be read again
+        result = await session.execute(
+            insert(Farm).values(
+                name=name,
+                owner_id=owner_id,
+                description=description,
+                boundary=boundary,
+                centroid=func.ST_Centroid(boundary),
+                area_sqm=func.ST_Area(cast(boundary, WGS84_GEOGRAPHY))
+            ).returning(Farm)
         )
-        area_query = area_result.scalar()
-
-        farm.area_sqm = area_query
+        farm = result.scalar_one()
 
         await session.commit()
-        await session.refresh(farm)
 
         if not await invalidate_patterns(user['uuid'], [
             "farms:user_list:*",
@@ -83,11 +124,8 @@ async def get_farm(
         include_geojson: bool = True
 ) -> Dict[str, Any]:
     try:
-        query = select(Farm)
-
-        query = query.filter(Farm.uuid == farm_id)
-
-        result = await session.execute(query)
+        query = FARM_WITH_GEOJSON_BY_UUID if include_geojson else FARM_BY_UUID
+        result = await session.execute(query, {'farm_id': farm_id})
         farm = result.scalar_one_or_none()
 
         if not farm:
@@ -97,10 +135,6 @@ async def get_farm(
                 "error": "Farm not found"
             }
 
-        if include_geojson:
-            farm.boundary_geojson = await get_boundary_as_geojson(session, farm.id)
-            farm.centroid_geojson = await get_centroid_as_geojson(session, farm.id)
-
         return {
             "status": "success",
             "data": farm.to_dict(include_geometry=include_geojson),
@@ -117,34 +151,95 @@ async def get_farm(
 
 
 
-@cached(cache=Cache.REDIS, ttl=86400,
-    key_builder=lambda f, session, user_id, include_geojson=True, skip=0, limit=100:
+@grouped_cached(cache=Cache.REDIS, ttl=86400,
+    key_builder=lambda f, session, user_id, include_geojson=True, skip=0, limit=100,
+                       bbox=None, simplify_tolerance=0.0, geometry="boundary":
     gen_user_key(user_id, "farms", "user_list",
-                  gen_query_hash({"skip": skip, "limit": limit, "include_geojson": include_geojson}))
+                  gen_query_hash({"skip": skip, "limit": limit, "include_geojson": include_geojson,
+                                  "bbox": bbox, "simplify_tolerance": simplify_tolerance,
+                                  "geometry": geometry}))
 )
 async def get_farms_by_owner(
         session: AsyncSession,
         user_id: str,
         include_geojson: bool = True,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        bbox: Optional[List[float]] = None,
+        simplify_tolerance: float = 0.0,
+        geometry: str = "boundary"
 ) -> Dict[str, Any]:
     try:
-        query = select(Farm).filter(
+        error = validate_farm_list_options(bbox, geometry)
+        if error:
+            return {
+                "status": "error",
+                "data": None,
+                "error": error
+            }
+
+        query = select_farm_list(include_geojson, bbox, simplify_tolerance, geometry).filter(
             Farm.owner_id == user_id
         ).offset(skip).limit(limit)
 
         result = await session.execute(query)
-        farms = result.scalars().all()
 
-        if include_geojson:
-            for farm in farms:
-                farm.boundary_geojson = await get_boundary_as_geojson(session, farm.id)
-                farm.centroid_geojson = await get_centroid_as_geojson(session, farm.id)
+        return {
+            "status": "success",
+            "data": farm_list_to_dicts(result, include_geojson, simplify_tolerance, geometry),
+            "error": None
+        }
+
+    except Exception as e:
+        return {
+            "status": "error",
+            "data": None,
+            "error": str(e)
+        }
+
+
+async def get_farms_as_featurecollection(
+        session: AsyncSession,
+        owner_id: str,
+        skip: int = 0,
+        limit: int = 100
+) -> Dict[str, Any]:
+    """Build the owner's farms as a GeoJSON FeatureCollection entirely in PostgreSQL.
+
+    data is the already-serialised FeatureCollection text, so it can be sent to
+    the client as-is without hydrating Farm objects or re-encoding geometry.
+    """
+    try:
+        page = select(
+            Farm.uuid,
+            Farm.name,
+            Farm.description,
+            Farm.area_sqm,
+            Farm.created_at,
+            Farm.updated_at,
+            Farm.boundary_geojson,
+            Farm.centroid_geojson
+        ).filter(
+            Farm.owner_id == owner_id
+        ).offset(skip).limit(limit).subquery()
+
+        feature = farm_feature(page.c)
+
+        query = select(
+            cast(
+                func.jsonb_build_object(
+                    'type', 'FeatureCollection',
+                    'features', func.coalesce(func.jsonb_agg(feature), literal_column("'[]'::jsonb"))
+                ),
+                Text
+            )
+        ).select_from(page)
+
+        result = await session.execute(query)
 
         return {
             "status": "success",
-            "data": [farm.to_dict(include_geometry=include_geojson) for farm in farms],
+            "data": result.scalar(),
             "error": None
         }
 
@@ -156,25 +251,56 @@ async def get_farms_by_owner(
         }
 
 
+async def stream_farms_as_featurecollection(
+        session: AsyncSession,
+        owner_id: str
+) -> AsyncIterator[str]:
+    """Stream the owner's farms as GeoJSON FeatureCollection text.
+
+    Features are serialised by PostgreSQL and pulled through a server-side
+    cursor in batches, so memory stays flat regardless of how many farms
+    the owner has.
+    """
+    query = select(
+        cast(farm_feature(Farm), Text)
+    ).filter(
+        Farm.owner_id == owner_id
+    ).execution_options(yield_per=100)
+
+    result = await session.stream(query)
+
+    yield '{"type":"FeatureCollection","features":['
+    separator = ''
+    async for feature in result.scalars():
+        yield separator + feature
+        separator = ','
+    yield ']}'
+
+
 async def get_all_farms(
         session: AsyncSession,
         skip: int = 0,
         limit: int = 100,
-        include_geojson: bool = False
+        include_geojson: bool = False,
+        bbox: Optional[List[float]] = None,
+        simplify_tolerance: float = 0.0,
+        geometry: str = "boundary"
 ) -> Dict[str, Any]:
     try:
-        query = select(Farm).offset(skip).limit(limit)
-        result = await session.execute(query)
-        farms = result.scalars().all()
+        error = validate_farm_list_options(bbox, geometry)
+        if error:
+            return {
+                "status": "error",
+                "data": None,
+                "error": error
+            }
 
-        if include_geojson:
-            for farm in farms:
-                farm.boundary_geojson = await get_boundary_as_geojson(session, farm.id)
-                farm.centroid_geojson = await get_centroid_as_geojson(session, farm.id)
+        query = select_farm_list(include_geojson, bbox, simplify_tolerance, geometry).offset(skip).limit(limit)
+        result = await session.execute(query)
 
         return {
             "status": "success",
-            "data": [farm.to_dict(include_geometry=include_geojson) for farm in farms],
+            "data": farm_list_to_dicts(result, include_geojson, simplify_tolerance, geometry),
             "error": None
         }
 
@@ -194,47 +320,40 @@ async def update_farm(
         boundary_geojson: Optional[Dict[str, Any]] = None
 ) -> Dict[str, Any]:
     try:
-        query = select(Farm).filter(Farm.uuid == farm_id)
-        result = await session.execute(query)
-        farm = result.scalar_one_or_none()
-
-        if not farm:
-            return {
-                "status": "error",
-                "data": None,
-                "error": "Farm not found"
-            }
+        values = {"updated_at": datetime.utcnow()}
 
         if name is not None:
-            farm.name = name
+            values["name"] = name
 
         if description is not None:
-            farm.description = description
+            values["description"] = description
 
         if boundary_geojson is not None:
-            boundary_shape = shape(boundary_geojson)
-
-            if not isinstance(boundary_shape, Polygon):
+            if boundary_geojson.get("type") != "Polygon":
                 raise ValueError("Boundary must be a Polygon")
 
-            farm.boundary = func.ST_GeomFromText(boundary_shape.wkt, 4326)
-            farm.centroid = func.ST_GeomFromText(boundary_shape.centroid.wkt, 4326)
-
-            await session.flush()
+            boundary = geojson_to_geometry(boundary_geojson)
+            values["boundary"] = boundary
+            values["centroid"] = func.ST_Centroid(boundary)
+            values["area_sqm"] = func.ST_Area(cast(boundary, WGS84_GEOGRAPHY))
 
-            area_result = await session.execute(
-                select(func.ST_Area(Farm.boundary)).filter(Farm.id == farm.id)
-            )
-            area_query = area_result.scalar()
-            farm.area_sqm = area_query
+        # Single UPDATE ... RETURNING: recalculates the area in the same
+        # statement and hands back the updated row without a re-read
+        result = await session.execute(
+            update(Farm).where(Farm.uuid == farm_id).values(**values)
+            .returning(Farm).options(undefer_group('geojson'))
+        )
+        farm = result.scalar_one_or_none()
 
-        farm.update_timestamp()
+        if not farm:
+            await session.rollback()
+            return {
+                "status": "error",
+                "data": None,
+                "error": "Farm not found"
+            }
 
         await session.commit()
-        await session.refresh(farm)
-
-        farm.boundary_geojson = await get_boundary_as_geojson(session, farm.id)
-        farm.centroid_geojson = await get_centroid_as_geojson(session, farm.id)
 
         return {
             "status": "success",
@@ -253,8 +372,7 @@ async def update_farm(
 
 async def delete_farm(session: AsyncSession, farm_id: str) -> Dict[str, Any]:
     try:
-        query = select(Farm).filter(Farm.uuid == farm_id)
-        result = await session.execute(query)
+        result = await session.execute(FARM_BY_UUID, {'farm_id': farm_id})
         farm = result.scalar_one_or_none()
 
         if not farm:
@@ -290,23 +408,30 @@ async def get_farms_within_area(
         limit: int = 50
 ) -> Dict[str, Any]:
     try:
-        center_point = func.ST_GeomFromText(f'POINT({center_lng} {center_lat})', 4326)
+        # Compare geography to geography so radius_meters is in meters and
+        # the planner can use the GiST index on farms.centroid
+        center_point = cast(
+            func.ST_SetSRID(func.ST_MakePoint(center_lng, center_lat), 4326),
+            WGS84_GEOGRAPHY
+        )
 
-        query = select(Farm).filter(
-            func.ST_DWithin(
+        if radius_meters == 0:
+            predicate = func.ST_Intersects(Farm.centroid, center_point)
+        else:
+            # No explicit && prefilter: ST_DWithin on geography already adds an
+            # index-backed bounding-box test against the radius-expanded point,
+            # whereas a degree-based ST_Expand would undershoot away from the equator
+            predicate = func.ST_DWithin(
                 Farm.centroid,
                 center_point,
                 radius_meters
             )
-        ).limit(limit)
+
+        query = select_farms().filter(predicate).limit(limit)
 
         result = await session.execute(query)
         farms = result.scalars().all()
 
-        for farm in farms:
-            farm.boundary_geojson = await get_boundary_as_geojson(session, farm.id)
-            farm.centroid_geojson = await get_centroid_as_geojson(session, farm.id)
-
         return {
             "status": "success",
             "data": [farm.to_dict(include_geometry=True) for farm in farms],
@@ -327,23 +452,23 @@ async def get_farms_intersecting_polygon(
         limit: int = 50
 ) -> Dict[str, Any]:
     try:
-        polygon_shape = shape(polygon_geojson)
-        polygon_wkt = func.ST_GeomFromText(polygon_shape.wkt, 4326)
-
-        query = select(Farm).filter(
+        polygon_geog = cast(geojson_to_geometry(polygon_geojson), WGS84_GEOGRAPHY)
+
+        # Explicit bounding-box test first so the planner can answer it from
+        # the GiST index on farms.boundary; the exact test only sees survivors.
+        # The box comes from the polygon itself rather than its lon/lat
+        # envelope, whose geodesic edges need not contain the polygon.
+        query = select_farms().filter(
+            Farm.boundary.op('&&')(polygon_geog),
             func.ST_Intersects(
                 Farm.boundary,
-                polygon_wkt
+                polygon_geog
             )
         ).limit(limit)
 
         result = await session.execute(query)
         farms = result.scalars().all()
 
-        for farm in farms:
-            farm.boundary_geojson = await get_boundary_as_geojson(session, farm.id)
-            farm.centroid_geojson = await get_centroid_as_geojson(session, farm.id)
-
         return {
             "status": "success",
             "data": [farm.to_dict(include_geometry=True) for farm in farms],
@@ -360,8 +485,7 @@ async def get_farms_intersecting_polygon(
 
 async def calculate_total_area_by_owner(session: AsyncSession, owner_id: str) -> Dict[str, Any]:
     try:
-        query = select(func.sum(Farm.area_sqm)).filter(Farm.owner_id == owner_id)
-        result = await session.execute(query)
+        result = await session.execute(TOTAL_AREA_BY_OWNER, {'owner_id': owner_id})
         total_area = result.scalar()
 
         return {
@@ -380,8 +504,7 @@ async def calculate_total_area_by_owner(session: AsyncSession, owner_id: str) ->
 
 async def count_farms_by_owner(session: AsyncSession, owner_id: str) -> Dict[str, Any]:
     try:
-        query = select(func.count(Farm.id)).filter(Farm.owner_id == owner_id)
-        result = await session.execute(query)
+        result = await session.execute(COUNT_FARMS_BY_OWNER, {'owner_id': owner_id})
         count = result.scalar()
 
         return {
@@ -398,20 +521,77 @@ async def count_farms_by_owner(session: AsyncSession, owner_id: str) -> Dict[str
         }
 
 
-async def get_boundary_as_geojson(session: AsyncSession, farm_id: int) -> Optional[Dict]:
-    query = select(func.ST_AsGeoJSON(Farm.boundary)).filter(Farm.id == farm_id)
-    result = await session.execute(query)
-    geojson = result.scalar()
+def select_farms(include_geojson: bool = True):
+    """Select farms, loading the stored GeoJSON columns only when they are needed"""
+    query = select(Farm)
+    if include_geojson:
+        query = query.options(undefer_group('geojson'))
+    return query
 
-    return json.loads(geojson) if geojson else None
 
+def validate_farm_list_options(bbox: Optional[List[float]], geometry: str) -> Optional[str]:
+    """Return an error message for invalid list options, or None"""
+    if bbox is not None and len(bbox) != 4:
+        return "bbox must be [min_lng, min_lat, max_lng, max_lat]"
 
-async def get_centroid_as_geojson(session: AsyncSession, farm_id: int) -> Optional[Dict]:
-    query = select(func.ST_AsGeoJSON(Farm.centroid)).filter(Farm.id == farm_id)
-    result = await session.execute(query)
-    geojson = result.scalar()
+    if geometry not in FARM_GEOMETRY_MODES:
+        return f"geometry must be one of: {', '.join(FARM_GEOMETRY_MODES)}"
 
-    return json.loads(geojson) if geojson else None
+    return None
+
+
+def select_farm_list(
+        include_geojson: bool = True,
+        bbox: Optional[List[float]] = None,
+        simplify_tolerance: float = 0.0,
+        geometry: str = "boundary"
+):
+    """Select farms for the list endpoints.
+
+    bbox limits results to farms whose boundary overlaps the box,
+    simplify_tolerance (in degrees) returns a simplified boundary built with
+    ST_SimplifyPreserveTopology, and geometry="centroid" returns only centroids.
+    """
+    query = select(Farm)
+
+    if include_geojson:
+        if geometry == "centroid":
+            query = query.options(undefer(Farm.centroid_geojson))
+        elif simplify_tolerance:
+            simplified = func.ST_SimplifyPreserveTopology(cast(Farm.boundary, WGS84_GEOMETRY), simplify_tolerance)
+            query = query.add_columns(
+                cast(func.ST_AsGeoJSON(simplified), JSONB).label('simplified_boundary')
+            ).options(undefer(Farm.centroid_geojson))
+        else:
+            query = query.options(undefer_group('geojson'))
+
+    if bbox:
+        envelope = cast(func.ST_MakeEnvelope(*(float(v) for v in bbox), 4326), WGS84_GEOGRAPHY)
+        query = query.filter(Farm.boundary.op('&&')(envelope))
+
+    return query
+
+
+def farm_list_to_dicts(
+        result,
+        include_geojson: bool = True,
+        simplify_tolerance: float = 0.0,
+        geometry: str = "boundary"
+) -> List[Dict[str, Any]]:
+    """Convert rows produced by select_farm_list() into farm dicts"""
+    farm_dicts = []
+    for row in result.all():
+        farm = row[0]
+        farm_dict = farm.to_dict()
+
+        if include_geojson:
+            if geometry == "boundary":
+                farm_dict['boundary'] = row.simplified_boundary if simplify_tolerance else farm.boundary_geojson
+            farm_dict['centroid'] = farm.centroid_geojson
+
+        farm_dicts.append(farm_dict)
+
+    return farm_dicts
 
 
 def validate_geojson_polygon(geojson_data: Dict[str, Any]) -> bool:
@@ -439,29 +619,8 @@ def validate_geojson_polygon(geojson_data: Dict[str, Any]) -> bool:
 
 async def get_farm_statistics(session: AsyncSession, owner_id: Optional[str] = None) -> Dict[str, Any]:
     try:
-        count_query = select(func.count(Farm.id))
-
-        if owner_id:
-            count_query = count_query.filter(Farm.owner_id == owner_id)
-
-        count_result = await session.execute(count_query)
-        total_farms = count_result.scalar()
-
-        if total_farms == 0:
-            return {
-                "status": "success",
-                "data": {
-                    'total_farms': 0,
-                    'total_area_sqm': 0,
-                    'total_area_hectares': 0,
-                    'average_area_sqm': 0,
-                    'smallest_farm_sqm': 0,
-                    'largest_farm_sqm': 0
-                },
-                "error": None
-            }
-
         stats_query = select(
+            func.count(Farm.id).label('total_farms'),
             func.sum(Farm.area_sqm).label('total_area'),
             func.avg(Farm.area_sqm).label('avg_area'),
             func.min(Farm.area_sqm).label('min_area'),
@@ -477,7 +636,7 @@ async def get_farm_statistics(session: AsyncSession, owner_id: Optional[str] = N
         return {
             "status": "success",
             "data": {
-                'total_farms': total_farms,
+                'total_farms': result.total_farms,
                 'total_area_sqm': float(result.total_area or 0),
                 'total_area_hectares': float(result.total_area or 0) / 10000,
                 'average_area_sqm': float(result.avg_area or 0),
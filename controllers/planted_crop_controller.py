@@ -1,11 +1,14 @@
 from typing import Optional, Dict, Any, List
 from datetime import datetime
+from functools import lru_cache
 
-from sqlalchemy import func, select, and_
+from sqlalchemy import func, select, update, and_, or_, exists, literal_column, type_coerce
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
-from aiocache import Cache, cached
+from sqlalchemy.orm import raiseload, selectinload
+from aiocache import Cache
 
+from decorators import handle_controller_errors
 from models.planted_crop import PlantedCrop
 from models.crop import Crop
 from models.plot import Plot, PlotType
@@ -13,194 +16,199 @@ from models.user import User
 from services.caching import *
 
 
+# Plot types a crop can be planted in
+CROP_PLOT_TYPES = frozenset({PlotType.FIELD, PlotType.PASTURE, PlotType.NATURAL_AREA, PlotType.GREEN_HOUSE})
+
+PLANTED_CROP_FIELDS = (
+    "planting_method",
+    "planting_spacing",
+    "seedling_age",
+    "number_of_crops",
+    "estimated_yield",
+    "notes"
+)
+PLANTED_CROP_DATE_FIELDS = ("germination_date", "transplant_date", "harvest_date")
+
+
+def pick_fields(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy the writable non-date planted crop fields present in data"""
+    return {key: data[key] for key in PLANTED_CROP_FIELDS if key in data}
+
+
+@lru_cache(maxsize=4096)
+def parse_iso_datetime(value: str) -> datetime:
+    """Parse an ISO 8601 string (trailing Z allowed) into a naive datetime"""
+    # fromisoformat is C-implemented and accepts 'Z' natively since 3.11
+    # Remove timezone info for database compatibility
+    return datetime.fromisoformat(value).replace(tzinfo=None)
+
+
+def parse_date_fields(data: Dict[str, Any]) -> Dict[str, Optional[datetime]]:
+    """Parse whichever planted crop date fields are present; empty values clear them.
+
+    Raises ValueError naming the first field that fails to parse.
+    """
+    dates = {}
+    for field in PLANTED_CROP_DATE_FIELDS:
+        if field in data:
+            try:
+                dates[field] = parse_iso_datetime(data[field]) if data[field] else None
+            except ValueError:
+                raise ValueError(f"Invalid {field} format")
+    return dates
+
+
+def user_exists(user_uuid: str):
+    """EXISTS clause for the authenticated user, folded into the endpoint's own query.
+
+    Planted crop rows reference users.uuid, so any returned row already
+    proves the user exists; this only matters when nothing matched.
+    """
+    return exists().where(User.uuid == user_uuid)
+
+
+def filter_if_exists(column, model, value: str):
+    """Match column == value, or everything if no model row has that UUID.
+
+    Keeps the old "ignore unknown plot/crop filters" behaviour without a
+    separate existence query.
+    """
+    return or_(column == value, ~exists().where(model.uuid == value))
+
+
+@handle_controller_errors(rollback=True)
 async def create_planted_crop(
         session: AsyncSession,
         user_uuid: str,
         data: Dict[str, Any]
 ) -> Dict[str, Any]:
     """Create a new planted crop entry"""
-    try:
-        # Validate required fields - keys are _id, values are UUIDs
-        crop_uuid = data.get("crop_id")
-        plot_uuid = data.get("plot_id")
-
-        if not all([crop_uuid, plot_uuid]):
-            return {
-                "status": "error",
-                "data": None,
-                "error": "crop_id and plot_id are required"
-            }
-
-        # Verify that crop, plot, and user exist and get their IDs
-        crop_query = select(Crop).filter(Crop.uuid == crop_uuid)
-        crop_result = await session.execute(crop_query)
-        crop = crop_result.scalar_one_or_none()
-        if not crop:
-            return {
-                "status": "error",
-                "data": None,
-                "error": f"Crop with uuid {crop_uuid} not found"
-            }
-
-        plot_query = select(Plot).filter(Plot.uuid == plot_uuid)
-        plot_result = await session.execute(plot_query)
-        plot = plot_result.scalar_one_or_none()
-        if not plot:
-            return {
-                "status": "error",
-                "data": None,
-                "error": f"Plot with uuid {plot_uuid} not found"
-            }
-
-        # Check if plot type allows crop planting
-        allowed_plot_types = [PlotType.FIELD, PlotType.PASTURE, PlotType.NATURAL_AREA, PlotType.GREEN_HOUSE]
-        if plot.plot_type not in allowed_plot_types:
-            return {
-                "status": "error",
-                "data": None,
-                "error": f"Cannot plant a crop in a {plot.plot_type.value} plot type"
-            }
-
-        user_query = select(User).filter(User.uuid == user_uuid)
-        user_result = await session.execute(user_query)
-        user = user_result.scalar_one_or_none()
-        if not user:
-            return {
-                "status": "error",
-                "data": None,
-                "error": f"User with uuid {user_uuid} not found"
-            }
-
-        # Parse dates if provided - remove timezone info for database compatibility
-        germination_date = None
-        if data.get("germination_date"):
-            try:
-                dt = datetime.fromisoformat(data["germination_date"].replace('Z', '+00:00'))
-                germination_date = dt.replace(tzinfo=None)  # Remove timezone info
-            except ValueError:
-                return {
-                    "status": "error",
-                    "data": None,
-                    "error": "Invalid germination_date format"
-                }
-
-        transplant_date = None
-        if data.get("transplant_date"):
-            try:
-                dt = datetime.fromisoformat(data["transplant_date"].replace('Z', '+00:00'))
-                transplant_date = dt.replace(tzinfo=None)  # Remove timezone info
-            except ValueError:
-                return {
-                    "status": "error",
-                    "data": None,
-                    "error": "Invalid transplant_date format"
-                }
-
-        harvest_date = None
-        if data.get("harvest_date"):
-            try:
-                dt = datetime.fromisoformat(data["harvest_date"].replace('Z', '+00:00'))
-                harvest_date = dt.replace(tzinfo=None)  # Remove timezone info
-            except ValueError:
-                return {
-                    "status": "error",
-                    "data": None,
-                    "error": "Invalid harvest_date format"
-                }
-        planted_crop = PlantedCrop(
-            crop_id=crop.uuid,
-            plot_id=plot.uuid,
-            user_id=user.uuid,
-            planting_method=data.get("planting_method"),
-            planting_spacing=data.get("planting_spacing"),
-            germination_date=germination_date,
-            transplant_date=transplant_date,
-            seedling_age=data.get("seedling_age"),
-            harvest_date=harvest_date,
-            number_of_crops=data.get("number_of_crops"),
-            estimated_yield=data.get("estimated_yield"),
-            notes=data.get("notes")
-        )
-
-        session.add(planted_crop)
-        await session.commit()
-        await session.refresh(planted_crop, ['crop', 'plot', 'user'])
-
-        # Invalidate relevant caches
-        await invalidate_patterns("system", [
-            "planted_crops:*",
-            f"plot:{plot.uuid}:*",
-            f"user:{user.uuid}:*",
-            "dashboard",
-            "stats:*"
-        ])
+    # Validate required fields - keys are _id, values are UUIDs
+    crop_uuid = data.get("crop_id")
+    plot_uuid = data.get("plot_id")
+
+    if not all([crop_uuid, plot_uuid]):
+        return {
+            "status": "error",
+            "data": None,
+            "error": "crop_id and plot_id are required"
+        }
+
+    # Verify that crop, plot, and user exist in a single round-trip;
+    # plot_type is non-nullable, so a NULL there means no such plot
+    lookup = select(
+        select(Crop.id).filter(Crop.uuid == crop_uuid).scalar_subquery().label('crop_pk'),
+        select(Plot.plot_type).filter(Plot.uuid == plot_uuid).scalar_subquery().label('plot_type'),
+        select(User.id).filter(User.uuid == user_uuid).scalar_subquery().label('user_pk')
+    )
+    refs = (await session.execute(lookup)).one()
 
+    if refs.crop_pk is None:
         return {
-            "status": "success",
-            "data": planted_crop.to_dict(),
-            "error": None
+            "status": "error",
+            "data": None,
+            "error": f"Crop with uuid {crop_uuid} not found"
         }
 
-    except Exception as e:
-        await session.rollback()
+    if refs.plot_type is None:
         return {
             "status": "error",
             "data": None,
-            "error": str(e)
+            "error": f"Plot with uuid {plot_uuid} not found"
         }
 
+    # Check if plot type allows crop planting
+    if refs.plot_type not in CROP_PLOT_TYPES:
+        return {
+            "status": "error",
+            "data": None,
+            "error": f"Cannot plant a crop in a {refs.plot_type.value} plot type"
+        }
 
+    if refs.user_pk is None:
+        return {
+            "status": "error",
+            "data": None,
+            "error": f"User with uuid {user_uuid} not found"
+        }
+
+    try:
+        dates = parse_date_fields(data)
+    except ValueError as e:
+        return {
+            "status": "error",
+            "data": None,
+            "error": str(e)
+        }
+
+    planted_crop = PlantedCrop(
+        crop_id=crop_uuid,
+        plot_id=plot_uuid,
+        user_id=user_uuid,
+        **pick_fields(data),
+        **dates
+    )
+
+    session.add(planted_crop)
+    await session.commit()
+
+    # Invalidate relevant caches
+    await invalidate_patterns(user_uuid, [
+        "planted_crops:*",
+        "dashboard",
+        "stats:*"
+    ])
+
+    return {
+        "status": "success",
+        "data": planted_crop.to_dict(),
+        "error": None
+    }
+
+
+@grouped_cached(cache=Cache.REDIS, ttl=60,
+    key_builder=lambda f, session, user_uuid, planted_crop_uuid:
+    gen_user_key(user_uuid, "planted_crops", "get", planted_crop_uuid),
+    skip_cache_func=lambda result: result["status"] != "success"
+)
+@handle_controller_errors()
 async def get_planted_crop(
         session: AsyncSession,
         user_uuid: str,
         planted_crop_uuid: str
 ) -> Dict[str, Any]:
     """Get a single planted crop by UUID (only if it belongs to the authenticated user)"""
-    try:
-        # Get user by UUID to get their ID for filtering
-        user_query = select(User).filter(User.uuid == user_uuid)
-        user_result = await session.execute(user_query)
-        user = user_result.scalar_one_or_none()
-
-        if not user:
-            return {
-                "status": "error",
-                "data": None,
-                "error": "User not found"
-            }
-
-        query = select(PlantedCrop).options(
-            selectinload(PlantedCrop.crop),
-            selectinload(PlantedCrop.plot),
-            selectinload(PlantedCrop.user)
-        ).filter(
-            PlantedCrop.uuid == planted_crop_uuid,
-            PlantedCrop.user_id == user.uuid
-        )
-        result = await session.execute(query)
-        planted_crop = result.scalar_one_or_none()
-
-        if not planted_crop:
-            return {
-                "status": "error",
-                "data": None,
-                "error": f"Planted crop with uuid {planted_crop_uuid} not found or access denied"
-            }
-
-        return {
-            "status": "success",
-            "data": planted_crop.to_dict(),
-            "error": None
-        }
-
-    except Exception as e:
+    # to_dict() reads no relationships; fail loudly if that ever changes
+    query = select(PlantedCrop).options(
+        raiseload('*')
+    ).filter(
+        PlantedCrop.uuid == planted_crop_uuid,
+        PlantedCrop.user_id == user_uuid
+    )
+    result = await session.execute(query)
+    planted_crop = result.scalar_one_or_none()
+
+    if not planted_crop:
         return {
             "status": "error",
             "data": None,
-            "error": str(e)
+            "error": f"Planted crop with uuid {planted_crop_uuid} not found or access denied"
         }
 
+    return {
+        "status": "success",
+        "data": planted_crop.to_dict(),
+        "error": None
+    }
+
 
+@grouped_cached(cache=Cache.REDIS, ttl=60,
+    key_builder=lambda f, session, user_uuid, skip=0, limit=100, plot_uuid=None, crop_uuid=None:
+    gen_user_key(user_uuid, "planted_crops", "list",
+                  gen_query_hash({"skip": skip, "limit": limit, "plot_uuid": plot_uuid, "crop_uuid": crop_uuid})),
+    skip_cache_func=lambda result: result["status"] != "success"
+)
+@handle_controller_errors()
 async def get_all_planted_crops(
         session: AsyncSession,
         user_uuid: str,
@@ -210,64 +218,44 @@ async def get_all_planted_crops(
         crop_uuid: Optional[str] = None
 ) -> Dict[str, Any]:
     """Get all planted crops with optional filtering (filtered by authenticated user)"""
-    try:
-        # Get user by UUID
-        user_query = select(User).filter(User.uuid == user_uuid)
-        user_result = await session.execute(user_query)
-        user = user_result.scalar_one_or_none()
-
-        if not user:
-            return {
-                "status": "error",
-                "data": None,
-                "error": "User not found"
-            }
-
-        query = select(PlantedCrop).options(
-            selectinload(PlantedCrop.crop),
-            selectinload(PlantedCrop.plot),
-            selectinload(PlantedCrop.user)
-        )
-
-        # Apply filters - always filter by user_id from token
-        filters = [PlantedCrop.user_id == user.uuid]
-
-        if plot_uuid:
-            plot_query = select(Plot).filter(Plot.uuid == plot_uuid)
-            plot_result = await session.execute(plot_query)
-            plot = plot_result.scalar_one_or_none()
-            if plot:
-                filters.append(PlantedCrop.plot_id == plot.uuid)
-
-        if crop_uuid:
-            crop_query = select(Crop).filter(Crop.uuid == crop_uuid)
-            crop_result = await session.execute(crop_query)
-            crop = crop_result.scalar_one_or_none()
-            if crop:
-                filters.append(PlantedCrop.crop_id == crop.uuid)
-
-        if filters:
-            query = query.filter(and_(*filters))
-
-        query = query.offset(skip).limit(limit).order_by(PlantedCrop.created_at.desc())
-
-        result = await session.execute(query)
-        planted_crops = result.scalars().all()
+    # to_dict() reads no relationships, so none are loaded
+    query = select(PlantedCrop)
 
-        return {
-            "status": "success",
-            "data": [pc.to_dict() for pc in planted_crops],
-            "error": None
-        }
+    # Apply filters - always filter by user_id from token
+    filters = [PlantedCrop.user_id == user_uuid]
 
-    except Exception as e:
+    if plot_uuid:
+        filters.append(filter_if_exists(PlantedCrop.plot_id, Plot, plot_uuid))
+
+    if crop_uuid:
+        filters.append(filter_if_exists(PlantedCrop.crop_id, Crop, crop_uuid))
+
+    if filters:
+        query = query.filter(and_(*filters))
+
+    query = query.offset(skip).limit(limit).order_by(PlantedCrop.created_at.desc())
+
+    # Serialise rows as they arrive instead of holding the ORM page and
+    # the dict page at the same time
+    result = await session.stream_scalars(query.execution_options(yield_per=50))
+    data = [pc.to_dict() async for pc in result]
+
+    # Only an empty page needs a separate check that the user exists
+    if not data and not await session.scalar(select(user_exists(user_uuid))):
         return {
             "status": "error",
             "data": None,
-            "error": str(e)
+            "error": "User not found"
         }
 
+    return {
+        "status": "success",
+        "data": data,
+        "error": None
+    }
+
 
+@handle_controller_errors(rollback=True)
 async def update_planted_crop(
         session: AsyncSession,
         user_uuid: str,
@@ -275,187 +263,99 @@ async def update_planted_crop(
         data: Dict[str, Any]
 ) -> Dict[str, Any]:
     """Update a planted crop entry (only if it belongs to the authenticated user)"""
+    # Only keys present in the request are written
+    values = pick_fields(data)
     try:
-        # Get user by UUID
-        user_query = select(User).filter(User.uuid == user_uuid)
-        user_result = await session.execute(user_query)
-        user = user_result.scalar_one_or_none()
-
-        if not user:
-            return {
-                "status": "error",
-                "data": None,
-                "error": "User not found"
-            }
-
-        query = select(PlantedCrop).options(
-            selectinload(PlantedCrop.crop),
-            selectinload(PlantedCrop.plot),
-            selectinload(PlantedCrop.user)
-        ).filter(
-            PlantedCrop.uuid == planted_crop_uuid,
-            PlantedCrop.user_id == user.uuid
-        )
-        result = await session.execute(query)
-        planted_crop = result.scalar_one_or_none()
-
-        if not planted_crop:
-            return {
-                "status": "error",
-                "data": None,
-                "error": f"Planted crop with uuid {planted_crop_uuid} not found or access denied"
-            }
-
-        # Update fields if provided
-        if "planting_method" in data:
-            planted_crop.planting_method = data["planting_method"]
-        if "planting_spacing" in data:
-            planted_crop.planting_spacing = data["planting_spacing"]
-        if "germination_date" in data:
-            if data["germination_date"]:
-                try:
-                    dt = datetime.fromisoformat(
-                        data["germination_date"].replace('Z', '+00:00')
-                    )
-                    planted_crop.germination_date = dt.replace(tzinfo=None)  # Remove timezone info
-                except ValueError:
-                    return {
-                        "status": "error",
-                        "data": None,
-                        "error": "Invalid germination_date format"
-                    }
-            else:
-                planted_crop.germination_date = None
-        if "transplant_date" in data:
-            if data["transplant_date"]:
-                try:
-                    dt = datetime.fromisoformat(
-                        data["transplant_date"].replace('Z', '+00:00')
-                    )
-                    planted_crop.transplant_date = dt.replace(tzinfo=None)  # Remove timezone info
-                except ValueError:
-                    return {
-                        "status": "error",
-                        "data": None,
-                        "error": "Invalid transplant_date format"
-                    }
-            else:
-                planted_crop.transplant_date = None
-        if "seedling_age" in data:
-            planted_crop.seedling_age = data["seedling_age"]
-        if "harvest_date" in data:
-            if data["harvest_date"]:
-                try:
-                    dt = datetime.fromisoformat(
-                        data["harvest_date"].replace('Z', '+00:00')
-                    )
-                    planted_crop.harvest_date = dt.replace(tzinfo=None)  # Remove timezone info
-                except ValueError:
-                    return {
-                        "status": "error",
-                        "data": None,
-                        "error": "Invalid harvest_date format"
-                    }
-            else:
-                planted_crop.harvest_date = None
-        if "number_of_crops" in data:
-            planted_crop.number_of_crops = data["number_of_crops"]
-        if "estimated_yield" in data:
-            planted_crop.estimated_yield = data["estimated_yield"]
-        if "notes" in data:
-            planted_crop.notes = data["notes"]
-
-        planted_crop.update_timestamp()
-        await session.commit()
-        await session.refresh(planted_crop)
-
-        # Invalidate relevant caches
-        await invalidate_patterns("system", [
-            "planted_crops:*",
-            f"plot:{planted_crop.plot_id}:*",
-            f"user:{planted_crop.user_id}:*",
-            "dashboard",
-            "stats:*"
-        ])
-
+        values.update(parse_date_fields(data))
+    except ValueError as e:
         return {
-            "status": "success",
-            "data": planted_crop.to_dict(),
-            "error": None
+            "status": "error",
+            "data": None,
+            "error": str(e)
         }
 
-    except Exception as e:
+    values["updated_at"] = datetime.utcnow()
+
+    # Write and read back in one round-trip; the ownership check is part
+    # of the WHERE clause, so no row comes back for someone else's crop
+    stmt = update(PlantedCrop).where(
+        PlantedCrop.uuid == planted_crop_uuid,
+        PlantedCrop.user_id == user_uuid
+    ).values(**values).returning(PlantedCrop).execution_options(
+        synchronize_session=False
+    )
+    result = await session.execute(stmt)
+    planted_crop = result.scalar_one_or_none()
+
+    if not planted_crop:
         await session.rollback()
         return {
             "status": "error",
             "data": None,
-            "error": str(e)
+            "error": f"Planted crop with uuid {planted_crop_uuid} not found or access denied"
         }
 
+    await session.commit()
 
+    # Invalidate relevant caches
+    await invalidate_patterns(user_uuid, [
+        "planted_crops:*",
+        "dashboard",
+        "stats:*"
+    ])
+
+    return {
+        "status": "success",
+        "data": planted_crop.to_dict(),
+        "error": None
+    }
+
+
+@handle_controller_errors(rollback=True)
 async def delete_planted_crop(
         session: AsyncSession,
         user_uuid: str,
         planted_crop_uuid: str
 ) -> Dict[str, Any]:
     """Delete a planted crop entry (only if it belongs to the authenticated user)"""
-    try:
-        # Get user by UUID
-        user_query = select(User).filter(User.uuid == user_uuid)
-        user_result = await session.execute(user_query)
-        user = user_result.scalar_one_or_none()
-
-        if not user:
-            return {
-                "status": "error",
-                "data": None,
-                "error": "User not found"
-            }
-
-        query = select(PlantedCrop).filter(
-            PlantedCrop.uuid == planted_crop_uuid,
-            PlantedCrop.user_id == user.uuid
-        )
-        result = await session.execute(query)
-        planted_crop = result.scalar_one_or_none()
-
-        if not planted_crop:
-            return {
-                "status": "error",
-                "data": None,
-                "error": f"Planted crop with uuid {planted_crop_uuid} not found or access denied"
-            }
-
-        plot_id = planted_crop.plot_id
-        user_id = planted_crop.user_id
-
-        await session.delete(planted_crop)
-        await session.commit()
-
-        # Invalidate relevant caches
-        await invalidate_patterns("system", [
-            "planted_crops:*",
-            f"plot:{plot_id}:*",
-            f"user:{user_id}:*",
-            "dashboard",
-            "stats:*"
-        ])
-
-        return {
-            "status": "success",
-            "data": {"message": f"Planted crop {planted_crop_uuid} deleted successfully"},
-            "error": None
-        }
-
-    except Exception as e:
-        await session.rollback()
+    query = select(PlantedCrop).filter(
+        PlantedCrop.uuid == planted_crop_uuid,
+        PlantedCrop.user_id == user_uuid
+    )
+    result = await session.execute(query)
+    planted_crop = result.scalar_one_or_none()
+
+    if not planted_crop:
         return {
             "status": "error",
             "data": None,
-            "error": str(e)
+            "error": f"Planted crop with uuid {planted_crop_uuid} not found or access denied"
         }
 
-
+    await session.delete(planted_crop)
+    await session.commit()
+
+    # Invalidate relevant caches
+    await invalidate_patterns(user_uuid, [
+        "planted_crops:*",
+        "dashboard",
+        "stats:*"
+    ])
+
+    return {
+        "status": "success",
+        "data": {"message": f"Planted crop {planted_crop_uuid} deleted successfully"},
+        "error": None
+    }
+
+
+@grouped_cached(cache=Cache.REDIS, ttl=60,
+    key_builder=lambda f, session, user_uuid, plot_uuid=None, crop_uuid=None:
+    gen_user_key(user_uuid, "planted_crops", "count",
+                  gen_query_hash({"plot_uuid": plot_uuid, "crop_uuid": crop_uuid})),
+    skip_cache_func=lambda result: result["status"] != "success"
+)
+@handle_controller_errors()
 async def count_planted_crops(
         session: AsyncSession,
         user_uuid: str,
@@ -463,58 +363,46 @@ async def count_planted_crops(
         crop_uuid: Optional[str] = None
 ) -> Dict[str, Any]:
     """Count planted crops with optional filtering (filtered by authenticated user)"""
-    try:
-        # Get user by UUID
-        user_query = select(User).filter(User.uuid == user_uuid)
-        user_result = await session.execute(user_query)
-        user = user_result.scalar_one_or_none()
-
-        if not user:
-            return {
-                "status": "error",
-                "data": None,
-                "error": "User not found"
-            }
-
-        query = select(func.count(PlantedCrop.id))
-
-        # Apply filters - always filter by user_id from token
-        filters = [PlantedCrop.user_id == user.uuid]
-
-        if plot_uuid:
-            plot_query = select(Plot).filter(Plot.uuid == plot_uuid)
-            plot_result = await session.execute(plot_query)
-            plot = plot_result.scalar_one_or_none()
-            if plot:
-                filters.append(PlantedCrop.plot_id == plot.uuid)
-
-        if crop_uuid:
-            crop_query = select(Crop).filter(Crop.uuid == crop_uuid)
-            crop_result = await session.execute(crop_query)
-            crop = crop_result.scalar_one_or_none()
-            if crop:
-                filters.append(PlantedCrop.crop_id == crop.uuid)
-
-        if filters:
-            query = query.filter(and_(*filters))
-
-        result = await session.execute(query)
-        count = result.scalar()
+    query = select(
+        func.count().label('count'),
+        user_exists(user_uuid).label('user_exists')
+    ).select_from(PlantedCrop)
 
-        return {
-            "status": "success",
-            "data": {"count": count},
-            "error": None
-        }
+    # Apply filters - always filter by user_id from token
+    filters = [PlantedCrop.user_id == user_uuid]
+
+    if plot_uuid:
+        filters.append(filter_if_exists(PlantedCrop.plot_id, Plot, plot_uuid))
+
+    if crop_uuid:
+        filters.append(filter_if_exists(PlantedCrop.crop_id, Crop, crop_uuid))
 
-    except Exception as e:
+    if filters:
+        query = query.filter(and_(*filters))
+
+    count, found = (await session.execute(query)).one()
+
+    if not found:
         return {
             "status": "error",
             "data": None,
-            "error": str(e)
+            "error": "User not found"
         }
 
+    return {
+        "status": "success",
+        "data": {"count": count},
+        "error": None
+    }
 
+
+@grouped_cached(cache=Cache.REDIS, ttl=60,
+    key_builder=lambda f, session, user_uuid, skip=0, limit=100, plot_uuid=None:
+    gen_user_key(user_uuid, "planted_crops", "details",
+                  gen_query_hash({"skip": skip, "limit": limit, "plot_uuid": plot_uuid})),
+    skip_cache_func=lambda result: result["status"] != "success"
+)
+@handle_controller_errors()
 async def get_planted_crops_with_details(
         session: AsyncSession,
         user_uuid: str,
@@ -523,136 +411,115 @@ async def get_planted_crops_with_details(
         plot_uuid: Optional[str] = None
 ) -> Dict[str, Any]:
     """Get planted crops with related crop, plot, and user details (filtered by authenticated user)"""
-    try:
-        # Get user by UUID
-        user_query = select(User).filter(User.uuid == user_uuid)
-        user_result = await session.execute(user_query)
-        user = user_result.scalar_one_or_none()
-
-        if not user:
-            return {
-                "status": "error",
-                "data": None,
-                "error": "User not found"
-            }
-
-        query = select(PlantedCrop).options(
-            selectinload(PlantedCrop.crop),
-            selectinload(PlantedCrop.plot),
-            selectinload(PlantedCrop.user)
-        )
-
-        # Apply filters - always filter by user_id from token
-        filters = [PlantedCrop.user_id == user.uuid]
-
-        if plot_uuid:
-            plot_query = select(Plot).filter(Plot.uuid == plot_uuid)
-            plot_result = await session.execute(plot_query)
-            plot = plot_result.scalar_one_or_none()
-            if plot:
-                filters.append(PlantedCrop.plot_id == plot.uuid)
-
-        if filters:
-            query = query.filter(and_(*filters))
-
-        query = query.offset(skip).limit(limit).order_by(PlantedCrop.created_at.desc())
-
-        result = await session.execute(query)
-        planted_crops = result.scalars().all()
-
-        data = []
-        for pc in planted_crops:
-            pc_dict = pc.to_dict()
-            pc_dict['crop'] = pc.crop.to_dict() if pc.crop else None
-            pc_dict['plot'] = pc.plot.to_dict() if pc.plot else None
-            pc_dict['user'] = {
-                'id': pc.user.uuid,
-                'username': pc.user.username,
-                'email': pc.user.email
-            } if pc.user else None
-            data.append(pc_dict)
-
-        return {
-            "status": "success",
-            "data": data,
-            "error": None
+    # Only three user columns are reported, so join for them instead of
+    # selectin-loading whole User rows in a second query
+    query = select(PlantedCrop, User.uuid, User.username, User.email).join(
+        User, PlantedCrop.user_id == User.uuid
+    ).options(
+        selectinload(PlantedCrop.crop),
+        selectinload(PlantedCrop.plot),
+        raiseload('*')
+    )
+
+    # Apply filters - always filter by user_id from token
+    filters = [PlantedCrop.user_id == user_uuid]
+
+    if plot_uuid:
+        filters.append(filter_if_exists(PlantedCrop.plot_id, Plot, plot_uuid))
+
+    if filters:
+        query = query.filter(and_(*filters))
+
+    query = query.offset(skip).limit(limit).order_by(PlantedCrop.created_at.desc())
+
+    result = await session.stream(query.execution_options(yield_per=50))
+
+    data = []
+    async for pc, owner_uuid, username, email in result:
+        pc_dict = pc.to_dict()
+        pc_dict['crop'] = pc.crop.to_dict() if pc.crop else None
+        pc_dict['plot'] = pc.plot.to_dict() if pc.plot else None
+        pc_dict['user'] = {
+            'id': owner_uuid,
+            'username': username,
+            'email': email
         }
+        data.append(pc_dict)
 
-    except Exception as e:
+    # Only an empty page needs a separate check that the user exists
+    if not data and not await session.scalar(select(user_exists(user_uuid))):
         return {
             "status": "error",
             "data": None,
-            "error": str(e)
+            "error": "User not found"
         }
 
+    return {
+        "status": "success",
+        "data": data,
+        "error": None
+    }
+
 
+@grouped_cached(cache=Cache.REDIS, ttl=60,
+    key_builder=lambda f, session, user_uuid:
+    gen_user_key(user_uuid, "stats", "planted_crops"),
+    skip_cache_func=lambda result: result["status"] != "success"
+)
+@handle_controller_errors()
 async def get_planted_crop_statistics(
         session: AsyncSession,
         user_uuid: str
 ) -> Dict[str, Any]:
     """Get statistics about planted crops for authenticated user"""
-    try:
-        # Get user by UUID
-        user_query = select(User).filter(User.uuid == user_uuid)
-        user_result = await session.execute(user_query)
-        user = user_result.scalar_one_or_none()
-
-        if not user:
-            return {
-                "status": "error",
-                "data": None,
-                "error": "User not found"
-            }
-
-        # Base query - always filter by user_id from token
-        base_filter = PlantedCrop.user_id == user.uuid
-
-        # Total count
-        total_query = select(func.count(PlantedCrop.id)).filter(base_filter)
-        total_result = await session.execute(total_query)
-        total_count = total_result.scalar()
-
-        # Count by plot - return UUIDs instead of integer IDs
-        by_plot_query = select(
-            Plot.uuid,
-            func.count(PlantedCrop.id).label('count')
-        ).join(Plot, PlantedCrop.plot_id == Plot.uuid).filter(base_filter).group_by(Plot.uuid)
-        by_plot_result = await session.execute(by_plot_query)
-        by_plot = [{"plot_id": row[0], "count": row[1]} for row in by_plot_result]
-
-        # Count by crop - return UUIDs instead of integer IDs
-        by_crop_query = select(
-            Crop.uuid,
-            func.count(PlantedCrop.id).label('count')
-        ).join(Crop, PlantedCrop.crop_id == Crop.uuid).filter(base_filter).group_by(Crop.uuid)
-        by_crop_result = await session.execute(by_crop_query)
-        by_crop = [{"crop_id": row[0], "count": row[1]} for row in by_crop_result]
-
-        # Total estimated yield
-        yield_query = select(func.sum(PlantedCrop.estimated_yield)).filter(base_filter)
-        yield_result = await session.execute(yield_query)
-        total_yield = yield_result.scalar() or 0
-
-        # Total plants
-        plants_query = select(func.sum(PlantedCrop.number_of_crops)).filter(base_filter)
-        plants_result = await session.execute(plants_query)
-        total_plants = plants_result.scalar() or 0
-
-        return {
-            "status": "success",
-            "data": {
-                "total_planted_crops": total_count,
-                "by_plot": by_plot,
-                "by_crop": by_crop,
-                "total_estimated_yield_kg": float(total_yield),
-                "total_plants": int(total_plants)
-            },
-            "error": None
-        }
-
-    except Exception as e:
+    # Base query - always filter by user_id from token
+    base_filter = PlantedCrop.user_id == user_uuid
+
+    # Per-plot and per-crop counts - return UUIDs instead of integer IDs
+    def counts_by(column, key):
+        grouped = select(
+            column.label('ref'),
+            func.count().label('count')
+        ).filter(base_filter).group_by(column).subquery()
+        return select(
+            func.coalesce(
+                func.jsonb_agg(func.jsonb_build_object(key, grouped.c.ref, 'count', grouped.c['count'])),
+                literal_column("'[]'::jsonb")
+            )
+        ).scalar_subquery()
+
+    # Totals and both breakdowns in a single round-trip
+    stats_query = select(
+        func.count().label('total_count'),
+        func.coalesce(func.sum(PlantedCrop.estimated_yield), 0).label('total_yield'),
+        func.coalesce(func.sum(PlantedCrop.number_of_crops), 0).label('total_plants'),
+        type_coerce(counts_by(PlantedCrop.plot_id, 'plot_id'), JSONB).label('by_plot'),
+        type_coerce(counts_by(PlantedCrop.crop_id, 'crop_id'), JSONB).label('by_crop'),
+        user_exists(user_uuid).label('user_exists')
+    ).filter(base_filter)
+    stats = (await session.execute(stats_query)).one()
+
+    if not stats.user_exists:
         return {
             "status": "error",
             "data": None,
-            "error": str(e)
+            "error": "User not found"
         }
+
+    total_count = stats.total_count
+    total_yield = stats.total_yield
+    total_plants = stats.total_plants
+    by_plot = stats.by_plot
+    by_crop = stats.by_crop
+
+    return {
+        "status": "success",
+        "data": {
+            "total_planted_crops": total_count,
+            "by_plot": by_plot,
+            "by_crop": by_crop,
+            "total_estimated_yield_kg": float(total_yield),
+            "total_plants": int(total_plants)
+        },
+        "error": None
+    }
@@ -1,38 +1,110 @@
 import json
-from typing import Optional, Dict, Any, List
+from datetime import datetime
+from typing import Optional, Dict, Any, List, NamedTuple, Tuple, AsyncIterator
 
-from shapely.geometry import shape, Polygon
-from sqlalchemy import func, select
+from shapely.geometry import Polygon
+from sqlalchemy import LargeBinary, Text, bindparam, case, cast, delete, func, insert, lambda_stmt, literal, select, type_coerce, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from aiocache import Cache, cached
-from geoalchemy2 import Geography
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.dialects.postgresql import JSONB, insert as pg_insert
+from aiocache import Cache
+from geoalchemy2 import Geometry
 
 from models.plot import Plot, PlotType
 from models.farm import Farm
-from models.plot_types import PLOT_TYPE_MODELS
+from models.plot_types import PLOT_TYPE_MODELS, PLOT_TYPE_SETTABLE_COLUMNS
 from services.caching import *
 
+WGS84_GEOMETRY = Geometry(srid=4326)
+
+
+class PlotTypeEntry(NamedTuple):
+    enum: PlotType
+    model: Optional[type]
+    settable_columns: frozenset
+
+
+# One lookup resolves a plot type string to its enum, model and writable
+# columns; a miss means the string is not a valid plot type
+PLOT_TYPE_DISPATCH = {
+    plot_type.value: PlotTypeEntry(
+        plot_type,
+        PLOT_TYPE_MODELS.get(plot_type.value),
+        PLOT_TYPE_SETTABLE_COLUMNS.get(plot_type.value, frozenset())
+    )
+    for plot_type in PlotType
+}
+
+# Built once; lambda_stmt caches the cache key by code location, so the
+# per-request plot lookups skip statement construction and traversal
+OWNED_PLOT_BY_UUID = lambda_stmt(
+    lambda: select(Plot).join(Farm).filter(
+        Plot.uuid == bindparam('plot_id'),
+        Farm.owner_id == bindparam('owner_id')
+    )
+)
+
+# Per-type lookups built once; callers bind plot_id / plot_type_id
+PLOT_TYPE_DATA_BY_PLOT = {
+    plot_type: select(plot_type_model).filter(plot_type_model.plot_id == bindparam('plot_id'))
+    for plot_type, plot_type_model in PLOT_TYPE_MODELS.items()
+}
+PLOT_TYPE_DATA_BY_UUID = {
+    plot_type: select(plot_type_model).filter(plot_type_model.uuid == bindparam('plot_type_id'))
+    for plot_type, plot_type_model in PLOT_TYPE_MODELS.items()
+}
+
+
+def geojson_to_polygon(geojson: Dict[str, Any]) -> Polygon:
+    """Build a shapely polygon from a GeoJSON Polygon whose type is already checked"""
+    shell, *holes = geojson["coordinates"]
+    # An empty holes list still goes through shapely's ring handling; None skips it
+    return Polygon(shell, holes or None)
+
+
+def polygon_to_geometry(polygon: Polygon):
+    """Bind a shapely polygon as WKB so PostGIS skips parsing WKT text"""
+    return func.ST_GeomFromWKB(type_coerce(polygon.wkb, LargeBinary), 4326)
+
+
+def plot_feature(source):
+    """Build a plot GeoJSON Feature as jsonb from Plot or a subquery's columns"""
+    return func.jsonb_build_object(
+        'type', 'Feature',
+        'id', source.uuid,
+        'geometry', cast(func.ST_AsGeoJSON(source.boundary), JSONB),
+        'properties', func.jsonb_build_object(
+            'uuid', source.uuid,
+            'name', source.name,
+            'farm_id', source.farm_id,
+            'plot_number', source.plot_number,
+            # The enum is stored by member name; clients see the value
+            'plot_type', case({t: t.value for t in PlotType}, value=source.plot_type),
+            'plot_type_id', source.plot_type_id,
+            'area_sqm', source.area_sqm,
+            'notes', source.notes,
+            'centroid', cast(func.ST_AsGeoJSON(source.centroid), JSONB),
+            'created_at', source.created_at,
+            'updated_at', source.updated_at
+        )
+    )
+
 
 async def create_plot_type_data(session: AsyncSession, plot_uuid: str, plot_type: str, plot_type_data: dict = None):
     """Create specific plot type data based on plot type"""
-    if plot_type not in PLOT_TYPE_MODELS:
+    entry = PLOT_TYPE_DISPATCH.get(plot_type)
+    if entry is None or entry.model is None:
         return None
     
-    plot_type_model = PLOT_TYPE_MODELS[plot_type]
+    plot_type_model = entry.model
     
-    # Create instance with basic fields
-    type_data = plot_type_model(
-        plot_id=plot_uuid,
-        name=plot_type_data.get('name', '') if plot_type_data else '',
-        notes=plot_type_data.get('notes', '') if plot_type_data else ''
-    )
-    
-    # Set specific fields based on plot type and provided data
+    values = {}
     if plot_type_data:
-        for key, value in plot_type_data.items():
-            if hasattr(type_data, key) and key not in ['plot_id', 'id', 'uuid', 'created_at', 'updated_at']:
-                setattr(type_data, key, value)
-    
+        values = {key: plot_type_data[key] for key in plot_type_data.keys() & entry.settable_columns}
+
+    # Build the instance with every field in one constructor call
+    type_data = plot_type_model(plot_id=plot_uuid, **{'name': '', 'notes': '', **values})
+
     session.add(type_data)
     await session.flush()  # Flush to get the UUID
     return type_data
@@ -43,10 +115,7 @@ async def get_plot_type_data(session: AsyncSession, plot_uuid: str, plot_type: s
     if plot_type not in PLOT_TYPE_MODELS:
         return None
     
-    plot_type_model = PLOT_TYPE_MODELS[plot_type]
-    
-    query = select(plot_type_model).filter(plot_type_model.plot_id == plot_uuid)
-    result = await session.execute(query)
+    result = await session.execute(PLOT_TYPE_DATA_BY_PLOT[plot_type], {'plot_id': plot_uuid})
     return result.scalar_one_or_none()
 
 
@@ -55,55 +124,44 @@ async def get_plot_type_data_by_uuid(session: AsyncSession, plot_type_uuid: str,
     if plot_type not in PLOT_TYPE_MODELS:
         return None
     
-    plot_type_model = PLOT_TYPE_MODELS[plot_type]
-    
-    query = select(plot_type_model).filter(plot_type_model.uuid == plot_type_uuid)
-    result = await session.execute(query)
+    result = await session.execute(PLOT_TYPE_DATA_BY_UUID[plot_type], {'plot_type_id': plot_type_uuid})
     return result.scalar_one_or_none()
 
 
 async def create_or_update_plot_type_data(session: AsyncSession, plot_uuid: str, plot_type: str, plot_type_data: dict = None, existing_plot_type_uuid: str = None):
     """Create or update plot type data and return the plot type UUID"""
-    if plot_type not in PLOT_TYPE_MODELS:
+    entry = PLOT_TYPE_DISPATCH.get(plot_type)
+    if entry is None or entry.model is None:
         return None
     
-    plot_type_model = PLOT_TYPE_MODELS[plot_type]
-    
-    # If we have an existing plot type UUID, try to update it
-    if existing_plot_type_uuid:
-        existing_data = await get_plot_type_data_by_uuid(session, existing_plot_type_uuid, plot_type)
-        if existing_data:
-            # Update existing record
-            if plot_type_data:
-                existing_data.name = plot_type_data.get('name', existing_data.name)
-                existing_data.notes = plot_type_data.get('notes', existing_data.notes)
-                
-                # Update specific fields
-                for key, value in plot_type_data.items():
-                    if hasattr(existing_data, key) and key not in ['plot_id', 'id', 'uuid', 'created_at', 'updated_at']:
-                        setattr(existing_data, key, value)
-                
-                existing_data.update_timestamp()
-            
-            await session.flush()
-            return existing_data.uuid
-    
-    # Create new record
-    type_data = plot_type_model(
+    plot_type_model = entry.model
+
+    values = {}
+    if plot_type_data:
+        values = {key: plot_type_data[key] for key in plot_type_data.keys() & entry.settable_columns}
+
+    insert_query = pg_insert(plot_type_model).values(
         plot_id=plot_uuid,
-        name=plot_type_data.get('name', '') if plot_type_data else '',
-        notes=plot_type_data.get('notes', '') if plot_type_data else ''
+        **{'name': '', 'notes': '', **values}
     )
-    
-    # Set specific fields based on plot type and provided data
+    if existing_plot_type_uuid:
+        insert_query = insert_query.values(uuid=existing_plot_type_uuid)
+
+    # Upsert on uuid: one atomic statement instead of SELECT then UPDATE/INSERT.
+    # With nothing to change the conflict still needs a SET for RETURNING to
+    # yield the existing row, so it rewrites the uuid onto itself.
     if plot_type_data:
-        for key, value in plot_type_data.items():
-            if hasattr(type_data, key) and key not in ['plot_id', 'id', 'uuid', 'created_at', 'updated_at']:
-                setattr(type_data, key, value)
-    
-    session.add(type_data)
-    await session.flush()  # Flush to get the UUID
-    return type_data.uuid
+        update_values = {**values, 'updated_at': datetime.utcnow()}
+    else:
+        update_values = {'uuid': insert_query.excluded.uuid}
+
+    upsert_query = insert_query.on_conflict_do_update(
+        index_elements=['uuid'],
+        set_=update_values
+    ).returning(plot_type_model.uuid)
+
+    result = await session.execute(upsert_query)
+    return result.scalar_one()
 
 
 async def delete_plot_type_data(session: AsyncSession, plot_uuid: str, plot_type: str):
@@ -111,10 +169,7 @@ async def delete_plot_type_data(session: AsyncSession, plot_uuid: str, plot_type
     if plot_type not in PLOT_TYPE_MODELS:
         return
     
-    plot_type_model = PLOT_TYPE_MODELS[plot_type]
-    
-    query = select(plot_type_model).filter(plot_type_model.plot_id == plot_uuid)
-    result = await session.execute(query)
+    result = await session.execute(PLOT_TYPE_DATA_BY_PLOT[plot_type], {'plot_id': plot_uuid})
     type_data = result.scalar_one_or_none()
     
     if type_data:
@@ -127,10 +182,7 @@ async def delete_plot_type_data_by_uuid(session: AsyncSession, plot_type_uuid: s
     if plot_type not in PLOT_TYPE_MODELS:
         return
     
-    plot_type_model = PLOT_TYPE_MODELS[plot_type]
-    
-    query = select(plot_type_model).filter(plot_type_model.uuid == plot_type_uuid)
-    result = await session.execute(query)
+    result = await session.execute(PLOT_TYPE_DATA_BY_UUID[plot_type], {'plot_type_id': plot_type_uuid})
     type_data = result.scalar_one_or_none()
     
     if type_data:
@@ -138,44 +190,105 @@ async def delete_plot_type_data_by_uuid(session: AsyncSession, plot_type_uuid: s
         await session.flush()  # Ensure deletion is processed
 
 
+def plot_type_data_delete_ctes(plot_uuids):
+    """DELETE ... RETURNING CTEs clearing every plot type table for the given plot uuids"""
+    return [
+        delete(plot_type_model)
+        .where(plot_type_model.plot_id.in_(plot_uuids))
+        .returning(plot_type_model.id)
+        .cte(f"deleted_{plot_type_model.__tablename__}")
+        for plot_type_model in PLOT_TYPE_MODELS.values()
+    ]
+
+
 async def delete_all_plot_type_data_for_plot(session: AsyncSession, plot_uuid: str):
     """Delete all plot type data for a plot across all plot type tables"""
-    deleted_count = 0
-    
-    # Go through all plot type models and delete any data referencing this plot
-    for plot_type, plot_type_model in PLOT_TYPE_MODELS.items():
-        query = select(plot_type_model).filter(plot_type_model.plot_id == plot_uuid)
-        result = await session.execute(query)
-        type_data_list = result.scalars().all()
-        
-        for type_data in type_data_list:
-            await session.delete(type_data)
-            deleted_count += 1
-    
-    if deleted_count > 0:
-        await session.flush()  # Ensure all deletions are processed
-    
-    return deleted_count
+    # One statement: a DELETE ... RETURNING CTE per plot type table, summed.
+    # A single session cannot run the deletes concurrently, so fold them
+    # into one round-trip instead.
+    deleted_counts = [
+        select(func.count()).select_from(deleted).scalar_subquery()
+        for deleted in plot_type_data_delete_ctes([plot_uuid])
+    ]
+
+    result = await session.execute(select(sum(deleted_counts[1:], deleted_counts[0])))
+    return result.scalar()
+
+
+# Everything Plot.to_dict reads, in a fixed order, so list endpoints can
+# build dicts from plain rows instead of materialising ORM instances
+PLOT_ROW_COLUMNS = (
+    Plot.id, Plot.uuid, Plot.name, Plot.farm_id, Plot.plot_number, Plot.plot_type,
+    Plot.area_sqm, Plot.notes, Plot.created_at, Plot.updated_at, Plot.plot_type_id
+)
+PLOT_GEOJSON_COLUMNS = (
+    func.ST_AsGeoJSON(Plot.boundary),
+    func.ST_AsGeoJSON(Plot.centroid)
+)
+PLOT_GEOJSON_BY_ID = select(*PLOT_GEOJSON_COLUMNS).filter(Plot.id == bindparam('plot_id'))
 
 
-async def attach_plot_type_data_to_plots(session: AsyncSession, plots, include_geojson=True):
-    """Helper function to attach plot type data to a list of plots"""
+def select_plot_rows(include_geojson=True):
+    """Select plot list columns, with boundary/centroid GeoJSON when requested"""
+    if include_geojson:
+        return select(*PLOT_ROW_COLUMNS, *PLOT_GEOJSON_COLUMNS)
+    return select(*PLOT_ROW_COLUMNS)
+
+
+async def plot_rows_to_dicts(session: AsyncSession, rows, include_geojson=True):
+    """Build Plot.to_dict-shaped dicts from select_plot_rows rows and attach plot type data"""
     plot_dicts = []
-    for plot in plots:
+    type_ids_by_type = {}
+    for (plot_id, plot_uuid, name, farm_id, plot_number, plot_type, area_sqm,
+         notes, created_at, updated_at, plot_type_id, *geojson) in rows:
+        plot_dict = {
+            'id': plot_id,
+            'uuid': plot_uuid,
+            'name': name,
+            'farm_id': farm_id,
+            'plot_number': plot_number,
+            'plot_type': plot_type.value if plot_type else None,
+            'area_sqm': area_sqm,
+            'notes': notes,
+            'created_at': created_at.isoformat() if created_at else None,
+            'updated_at': updated_at.isoformat() if updated_at else None,
+        }
         if include_geojson:
-            plot.boundary_geojson = await get_plot_boundary_as_geojson(session, plot.id)
-            plot.centroid_geojson = await get_plot_centroid_as_geojson(session, plot.id)
+            boundary, centroid = geojson
+            plot_dict['boundary'] = json.loads(boundary) if boundary else None
+            plot_dict['centroid'] = json.loads(centroid) if centroid else None
 
-        plot_dict = plot.to_dict(include_geometry=include_geojson)
-        
-        # Get plot type data using the new relationship
-        if plot.plot_type_id:
-            type_data = await plot.get_plot_type_data(session)
-            if type_data:
-                plot_dict['plot_type_data'] = type_data.to_dict()
-        
-        plot_dicts.append(plot_dict)
-    
+        if plot_type_id and plot_type and plot_type.value in PLOT_TYPE_MODELS:
+            type_ids_by_type.setdefault(plot_type.value, []).append(plot_type_id)
+
+        plot_dicts.append((plot_dict, plot_type_id))
+
+    # One query per plot type table instead of one per plot
+    type_data_by_uuid = {}
+    for plot_type, type_ids in type_ids_by_type.items():
+        plot_type_model = PLOT_TYPE_MODELS[plot_type]
+        type_result = await session.execute(
+            select(plot_type_model).filter(plot_type_model.uuid.in_(type_ids))
+        )
+        for type_data in type_result.scalars():
+            type_data_by_uuid[type_data.uuid] = type_data.to_dict()
+
+    for plot_dict, plot_type_id in plot_dicts:
+        if plot_type_id in type_data_by_uuid:
+            plot_dict['plot_type_data'] = type_data_by_uuid[plot_type_id]
+
+    return [plot_dict for plot_dict, _ in plot_dicts]
+
+
+async def fetch_plot_dicts(session: AsyncSession, query, include_geojson=True, chunk_size=100):
+    """Run a select_plot_rows query and build plot dicts a chunk at a time"""
+    # Rows come through a server-side cursor, so only one chunk of raw rows
+    # (and their GeoJSON text) is held alongside the dicts built so far
+    result = await session.stream(query.execution_options(yield_per=chunk_size))
+
+    plot_dicts = []
+    async for rows in result.partitions():
+        plot_dicts.extend(await plot_rows_to_dicts(session, rows, include_geojson))
     return plot_dicts
 
 
@@ -193,100 +306,83 @@ async def create_plot(
         boundary_geojson = data["geojson"]
         plot_type_data = data.get("plot_type_data")
 
-        # Validate farm exists and user has access
-        farm_query = select(Farm).filter(Farm.uuid == farm_id, Farm.owner_id == user["uuid"])
-        farm_result = await session.execute(farm_query)
-        farm = farm_result.scalar_one_or_none()
-        
-        if not farm:
-            return {
-                "status": "error",
-                "message": "Farm not found or access denied",
-            }
-
         # Validate plot type
-        try:
-            plot_type = PlotType(plot_type_str)
-        except ValueError:
+        plot_type_entry = PLOT_TYPE_DISPATCH.get(plot_type_str)
+        if plot_type_entry is None:
             return {
                 "status": "error",
                 "message": f"Invalid plot type: {plot_type_str}",
             }
 
-        boundary_shape = shape(boundary_geojson)
-
-        if not isinstance(boundary_shape, Polygon):
+        # Check the GeoJSON type before GEOS builds anything
+        if boundary_geojson.get("type") != "Polygon":
             return {
                 "status": "error",
                 "message": "Invalid shape - must be a polygon",
             }
 
-        # Check if plot boundary is within farm boundary
-        plot_geometry = func.ST_GeomFromText(boundary_shape.wkt, 4326)
-        
-        try:
-            # Use ST_Within with both geometries converted to the same coordinate system
-            # Convert farm geography to geometry for comparison
-            boundary_check_query = select(
-                func.ST_Within(
-                    plot_geometry,
-                    func.ST_GeomFromText(func.ST_AsText(Farm.boundary), 4326)
-                )
-            ).filter(Farm.uuid == farm.uuid)
-            
-            boundary_check_result = await session.execute(boundary_check_query)
-            is_within_farm = boundary_check_result.scalar()
-            
-            if not is_within_farm:
-                return {
-                    "status": "error",
-                    "message": "Plot boundary must be within the farm boundary",
-                }
-        except Exception as e:
-            # If boundary check fails, log and allow creation for now
-            print(f"Boundary validation failed: {e}")
-            # Uncomment next line to enforce boundary validation
-            # return {"status": "error", "message": f"Boundary validation error: {e}"}
-
-        centroid = boundary_shape.centroid
-
-        plot = Plot(
-            name=name,
-            farm_id=farm_id,  # Use UUID for FK relationship
-            plot_type=plot_type,
-            plot_number=plot_number,
-            notes=notes
+        boundary_shape = geojson_to_polygon(boundary_geojson)
+
+        # The boundary is parsed once in a CTE. The INSERT ... SELECT only
+        # yields a row when the farm is the user's and contains the plot, so
+        # the happy path is a single round-trip; the centroid is derived by
+        # PostGIS in the same statement and area_sqm is a generated column.
+        plot_geometry = select(
+            polygon_to_geometry(boundary_shape).label('geom')
+        ).cte('plot_geometry').c.geom
+
+        plot_source = select(
+            literal(name, Plot.name.type),
+            Farm.uuid,  # Use UUID for FK relationship
+            literal(plot_type_entry.enum, Plot.plot_type.type),
+            literal(plot_number, Plot.plot_number.type),
+            literal(notes, Plot.notes.type),
+            plot_geometry,
+            func.ST_Centroid(plot_geometry)
+        ).filter(
+            Farm.uuid == farm_id,
+            Farm.owner_id == user["uuid"],
+            func.ST_Within(plot_geometry, cast(Farm.boundary, WGS84_GEOMETRY))
         )
 
-        plot.boundary = plot_geometry
-        plot.centroid = func.ST_GeomFromText(centroid.wkt, 4326)
+        insert_query = insert(Plot).from_select(
+            ['name', 'farm_id', 'plot_type', 'plot_number', 'notes', 'boundary', 'centroid'],
+            plot_source
+        ).returning(Plot)
 
-        session.add(plot)
-        await session.flush()
+        plot = (await session.execute(insert_query)).scalar_one_or_none()
 
-        # Calculate area
-        area_result = await session.execute(
-            select(func.ST_Area(Plot.boundary)).filter(Plot.id == plot.id)
-        )
-        area_query = area_result.scalar()
-        plot.area_sqm = area_query
+        if plot is None:
+            # Nothing inserted: find out which condition failed
+            farm_check_query = select(Farm.id).filter(
+                Farm.uuid == farm_id,
+                Farm.owner_id == user["uuid"]
+            )
+            if (await session.execute(farm_check_query)).first() is None:
+                return {
+                    "status": "error",
+                    "message": "Farm not found or access denied",
+                }
 
-        await session.commit()
-        await session.refresh(plot)
+            return {
+                "status": "error",
+                "message": "Plot boundary must be within the farm boundary",
+            }
 
-        # Create plot type specific data if provided
+        # Plot and its type data commit together, so a failure here cannot
+        # leave a plot without the type data it was created with
         if plot_type_data:
             plot_type_uuid = await create_or_update_plot_type_data(session, plot.uuid, plot_type_str, plot_type_data)
             if plot_type_uuid:
                 plot.plot_type_id = plot_type_uuid  # Set the relationship
-                
+
         await session.commit()
-        await session.refresh(plot)  # Refresh to get the relationship data
 
         # Invalidate relevant caches
         if not await invalidate_patterns(user['uuid'], [
-            f"plots:farm:{farm.uuid}:*",
-            f"plots:user:*",
+            f"plots:farm:{farm_id}:*",
+            "plots:user_list:*",
+            "plots:type:*",
             "plots:count",
             "dashboard",
             "stats:*"
@@ -323,12 +419,9 @@ async def get_plot(
 ) -> Dict[str, Any]:
     try:
         # Join with farm to check ownership
-        query = select(Plot).join(Farm).filter(
-            Plot.uuid == plot_id,
-            Farm.owner_id == user["uuid"]
+        result = await session.execute(
+            OWNED_PLOT_BY_UUID, {'plot_id': plot_id, 'owner_id': user["uuid"]}
         )
-
-        result = await session.execute(query)
         plot = result.scalar_one_or_none()
 
         if not plot:
@@ -339,8 +432,7 @@ async def get_plot(
             }
 
         if include_geojson:
-            plot.boundary_geojson = await get_plot_boundary_as_geojson(session, plot.id)
-            plot.centroid_geojson = await get_plot_centroid_as_geojson(session, plot.id)
+            plot.boundary_geojson, plot.centroid_geojson = await get_plot_geojson(session, plot.id)
 
         # Get plot type data using the new relationship
         plot_dict = plot.to_dict(include_geometry=include_geojson)
@@ -363,10 +455,11 @@ async def get_plot(
         }
 
 
-@cached(cache=Cache.REDIS, ttl=86400,
+@grouped_cached(cache=Cache.REDIS, ttl=86400,
     key_builder=lambda f, session, user_id, farm_id, include_geojson=True, skip=0, limit=100:
     gen_user_key(user_id, "plots", "farm", farm_id,
-                  gen_query_hash({"skip": skip, "limit": limit, "include_geojson": include_geojson}))
+                  gen_query_hash({"skip": skip, "limit": limit, "include_geojson": include_geojson})),
+    skip_cache_func=lambda result: result["status"] != "success"
 )
 async def get_plots_by_farm(
         session: AsyncSession,
@@ -389,14 +482,11 @@ async def get_plots_by_farm(
                 "error": "Farm not found"
             }
 
-        query = select(Plot).filter(
+        query = select_plot_rows(include_geojson).filter(
             Plot.farm_id == farm.uuid
         ).offset(skip).limit(limit)
 
-        result = await session.execute(query)
-        plots = result.scalars().all()
-
-        plot_dicts = await attach_plot_type_data_to_plots(session, plots, include_geojson)
+        plot_dicts = await fetch_plot_dicts(session, query, include_geojson)
 
         return {
             "status": "success",
@@ -413,10 +503,11 @@ async def get_plots_by_farm(
         }
 
 
-@cached(cache=Cache.REDIS, ttl=86400,
+@grouped_cached(cache=Cache.REDIS, ttl=86400,
     key_builder=lambda f, session, user_id, include_geojson=True, skip=0, limit=100:
     gen_user_key(user_id, "plots", "user_list",
-                  gen_query_hash({"skip": skip, "limit": limit, "include_geojson": include_geojson}))
+                  gen_query_hash({"skip": skip, "limit": limit, "include_geojson": include_geojson})),
+    skip_cache_func=lambda result: result["status"] != "success"
 )
 async def get_plots_by_user(
         session: AsyncSession,
@@ -426,14 +517,11 @@ async def get_plots_by_user(
         limit: int = 100
 ) -> Dict[str, Any]:
     try:
-        query = select(Plot).join(Farm).filter(
+        query = select_plot_rows(include_geojson).join(Farm).filter(
             Farm.owner_id == user_id
         ).offset(skip).limit(limit)
 
-        result = await session.execute(query)
-        plots = result.scalars().all()
-
-        plot_dicts = await attach_plot_type_data_to_plots(session, plots, include_geojson)
+        plot_dicts = await fetch_plot_dicts(session, query, include_geojson)
 
         return {
             "status": "success",
@@ -449,6 +537,34 @@ async def get_plots_by_user(
         }
 
 
+async def stream_plots_as_featurecollection(
+        session: AsyncSession,
+        owner_id: str,
+        farm_id: Optional[str] = None
+) -> AsyncIterator[str]:
+    """Stream the owner's plots as GeoJSON FeatureCollection text.
+
+    Features are serialised by PostgreSQL and pulled through a server-side
+    cursor in batches, so geometry never goes through json.loads/dumps here.
+    """
+    query = select(
+        cast(plot_feature(Plot), Text)
+    ).join(Farm).filter(
+        Farm.owner_id == owner_id
+    )
+    if farm_id:
+        query = query.filter(Plot.farm_id == farm_id)
+
+    result = await session.stream(query.execution_options(yield_per=100))
+
+    yield '{"type":"FeatureCollection","features":['
+    separator = ''
+    async for feature in result.scalars():
+        yield separator + feature
+        separator = ','
+    yield ']}'
+
+
 async def update_plot(
         session: AsyncSession,
         plot_id: str,
@@ -462,11 +578,9 @@ async def update_plot(
 ) -> Dict[str, Any]:
     try:
         # Join with farm to check ownership
-        query = select(Plot).join(Farm).filter(
-            Plot.uuid == plot_id,
-            Farm.owner_id == user["uuid"]
+        result = await session.execute(
+            OWNED_PLOT_BY_UUID, {'plot_id': plot_id, 'owner_id': user["uuid"]}
         )
-        result = await session.execute(query)
         plot = result.scalar_one_or_none()
 
         if not plot:
@@ -483,60 +597,51 @@ async def update_plot(
             plot.plot_number = plot_number
 
         if plot_type is not None:
-            try:
-                plot.plot_type = PlotType(plot_type)
-            except ValueError:
+            plot_type_entry = PLOT_TYPE_DISPATCH.get(plot_type)
+            if plot_type_entry is None:
                 return {
                     "status": "error",
                     "data": None,
                     "error": f"Invalid plot type: {plot_type}"
                 }
+            plot.plot_type = plot_type_entry.enum
 
         if notes is not None:
             plot.notes = notes
 
         if boundary_geojson is not None:
-            boundary_shape = shape(boundary_geojson)
-
-            if not isinstance(boundary_shape, Polygon):
+            if boundary_geojson.get("type") != "Polygon":
                 raise ValueError("Boundary must be a Polygon")
 
-            # Check if updated plot boundary is within farm boundary
-            plot_geometry = func.ST_GeomFromText(boundary_shape.wkt, 4326)
-            
-            try:
-                boundary_check_query = select(
-                    func.ST_Within(
-                        plot_geometry,
-                        func.ST_GeomFromText(func.ST_AsText(Farm.boundary), 4326)
-                    )
-                ).filter(Farm.uuid == plot.farm_id)
-                
-                boundary_check_result = await session.execute(boundary_check_query)
-                is_within_farm = boundary_check_result.scalar()
-                
-                if not is_within_farm:
-                    return {
-                        "status": "error",
-                        "data": None,
-                        "error": "Updated plot boundary must be within the farm boundary"
-                    }
-            except Exception as e:
-                print(f"Update boundary validation failed: {e}")
-                # Uncomment next line to enforce boundary validation
-                # return {"status": "error", "message": f"Boundary validation error: {e}"}
-
-            plot.boundary = plot_geometry
-            plot.centroid = func.ST_GeomFromText(boundary_shape.centroid.wkt, 4326)
-
-            await session.flush()
-
-            # Recalculate area
-            area_result = await session.execute(
-                select(func.ST_Area(Plot.boundary)).filter(Plot.id == plot.id)
-            )
-            area_query = area_result.scalar()
-            plot.area_sqm = area_query
+            boundary_shape = geojson_to_polygon(boundary_geojson)
+
+            # Containment check, geometry and centroid in one UPDATE; area_sqm
+            # is regenerated from the boundary and returned. No row back
+            # means the boundary is outside the farm
+            plot_geometry = select(
+                polygon_to_geometry(boundary_shape).label('geom')
+            ).cte('plot_geometry').c.geom
+
+            boundary_update = update(Plot).where(
+                Plot.id == plot.id,
+                Farm.uuid == Plot.farm_id,
+                func.ST_Within(plot_geometry, cast(Farm.boundary, WGS84_GEOMETRY))
+            ).values(
+                boundary=plot_geometry,
+                centroid=func.ST_Centroid(plot_geometry)
+            ).returning(Plot.area_sqm).execution_options(synchronize_session=False)
+
+            area_sqm = (await session.execute(boundary_update)).scalar_one_or_none()
+
+            if area_sqm is None:
+                return {
+                    "status": "error",
+                    "data": None,
+                    "error": "Updated plot boundary must be within the farm boundary"
+                }
+
+            # Generated column: record the new value without flushing it
+            set_committed_value(plot, 'area_sqm', area_sqm)
 
         # Handle plot type data updates
         if plot_type_data is not None:
@@ -568,24 +673,18 @@ async def update_plot(
         plot.update_timestamp()
 
         await session.commit()
-        await session.refresh(plot)
-
-        # Get farm for cache invalidation
-        farm_query = select(Farm).filter(Farm.uuid == plot.farm_id)
-        farm_result = await session.execute(farm_query)
-        farm = farm_result.scalar_one()
 
         # Invalidate relevant caches
         await invalidate_patterns(user['uuid'], [
-            f"plots:farm:{farm.uuid}:*",
-            f"plots:user:*",
+            f"plots:farm:{plot.farm_id}:*",
+            "plots:user_list:*",
+            "plots:type:*",
             "plots:count",
             "dashboard",
             "stats:*"
         ])
 
-        plot.boundary_geojson = await get_plot_boundary_as_geojson(session, plot.id)
-        plot.centroid_geojson = await get_plot_centroid_as_geojson(session, plot.id)
+        plot.boundary_geojson, plot.centroid_geojson = await get_plot_geojson(session, plot.id)
 
         # Get plot type data using the new relationship
         plot_dict = plot.to_dict(include_geometry=True)
@@ -615,37 +714,40 @@ async def delete_plot(
         user: Dict[str, Any]
 ) -> Dict[str, Any]:
     try:
-        # Join with farm to check ownership
-        query = select(Plot).join(Farm).filter(
-            Plot.uuid == plot_id,
-            Farm.owner_id == user["uuid"]
+        # One statement: resolve the owned plot, clear its plot type rows
+        # (the foreign keys have no ON DELETE CASCADE) and delete the plot.
+        # FK checks run at the end of the statement, so CTE order is moot.
+        owned_plot = (
+            select(Plot.uuid)
+            .join(Farm, Farm.uuid == Plot.farm_id)
+            .filter(Plot.uuid == plot_id, Farm.owner_id == user["uuid"])
+            .cte("owned_plot")
         )
-        result = await session.execute(query)
-        plot = result.scalar_one_or_none()
+        owned_plot_uuids = select(owned_plot.c.uuid)
+
+        result = await session.execute(
+            delete(Plot)
+            .where(Plot.uuid.in_(owned_plot_uuids))
+            .add_cte(*plot_type_data_delete_ctes(owned_plot_uuids))
+            .returning(Plot.farm_id)
+            .execution_options(synchronize_session=False)
+        )
+        farm_id = result.scalar_one_or_none()
 
-        if not plot:
+        if farm_id is None:
             return {
                 "status": "error",
                 "data": None,
                 "error": "Plot not found"
             }
 
-        # Get farm for cache invalidation
-        farm_query = select(Farm).filter(Farm.uuid == plot.farm_id)
-        farm_result = await session.execute(farm_query)
-        farm = farm_result.scalar_one()
-
-        # Delete ALL related plot type data first to avoid foreign key constraint violation
-        # This comprehensive function will check all plot type tables for any data referencing this plot
-        deleted_count = await delete_all_plot_type_data_for_plot(session, plot.uuid)
-
-        await session.delete(plot)
         await session.commit()
 
         # Invalidate relevant caches
         await invalidate_patterns(user['uuid'], [
-            f"plots:farm:{farm.uuid}:*",
-            f"plots:user:*",
+            f"plots:farm:{farm_id}:*",
+            "plots:user_list:*",
+            "plots:type:*",
             "plots:count",
             "dashboard",
             "stats:*"
@@ -666,6 +768,12 @@ async def delete_plot(
         }
 
 
+@grouped_cached(cache=Cache.REDIS, ttl=86400,
+    key_builder=lambda f, session, user_id, plot_type, include_geojson=True, skip=0, limit=100:
+    gen_user_key(user_id, "plots", "type", plot_type,
+                  gen_query_hash({"skip": skip, "limit": limit, "include_geojson": include_geojson})),
+    skip_cache_func=lambda result: result["status"] != "success"
+)
 async def get_plots_by_type(
         session: AsyncSession,
         user_id: str,
@@ -676,24 +784,20 @@ async def get_plots_by_type(
 ) -> Dict[str, Any]:
     try:
         # Validate plot type
-        try:
-            plot_type_enum = PlotType(plot_type)
-        except ValueError:
+        plot_type_entry = PLOT_TYPE_DISPATCH.get(plot_type)
+        if plot_type_entry is None:
             return {
                 "status": "error",
                 "data": None,
                 "error": f"Invalid plot type: {plot_type}"
             }
 
-        query = select(Plot).join(Farm).filter(
+        query = select_plot_rows(include_geojson).join(Farm).filter(
             Farm.owner_id == user_id,
-            Plot.plot_type == plot_type_enum
+            Plot.plot_type == plot_type_entry.enum
         ).offset(skip).limit(limit)
 
-        result = await session.execute(query)
-        plots = result.scalars().all()
-
-        plot_dicts = await attach_plot_type_data_to_plots(session, plots, include_geojson)
+        plot_dicts = await fetch_plot_dicts(session, query, include_geojson)
 
         return {
             "status": "success",
@@ -709,24 +813,33 @@ async def get_plots_by_type(
         }
 
 
-async def count_plots_by_farm(session: AsyncSession, farm_id: str) -> Dict[str, Any]:
+@grouped_cached(cache=Cache.REDIS, ttl=3600,
+    key_builder=lambda f, session, user_id, farm_id:
+    gen_user_key(user_id, "stats", "plots", "farm", farm_id, "count"),
+    skip_cache_func=lambda result: result["status"] != "success"
+)
+async def count_plots_by_farm(
+        session: AsyncSession,
+        user_id: str,  # farm owner; also keys the cache
+        farm_id: str
+) -> Dict[str, Any]:
     try:
-        # Get farm first to validate it exists
-        farm_query = select(Farm).filter(Farm.uuid == farm_id)
-        farm_result = await session.execute(farm_query)
-        farm = farm_result.scalar_one_or_none()
-        
-        if not farm:
+        # Farm ownership and the count in one query: no row means the farm is
+        # missing or not the caller's. Scoping to the owner keeps the cached
+        # entry in the namespace the owner's plot writes invalidate.
+        query = select(
+            select(func.count(Plot.id)).filter(Plot.farm_id == Farm.uuid).scalar_subquery()
+        ).filter(Farm.uuid == farm_id, Farm.owner_id == user_id)
+        result = await session.execute(query)
+        count = result.scalar_one_or_none()
+
+        if count is None:
             return {
                 "status": "error",
                 "data": None,
-                "error": "Farm not found"
+                "error": "Farm not found or access denied"
             }
 
-        query = select(func.count(Plot.id)).filter(Plot.farm_id == farm.uuid)
-        result = await session.execute(query)
-        count = result.scalar()
-
         return {
             "status": "success",
             "data": {"count": count},
@@ -741,27 +854,37 @@ async def count_plots_by_farm(session: AsyncSession, farm_id: str) -> Dict[str,
         }
 
 
-async def calculate_total_plot_area_by_farm(session: AsyncSession, farm_id: str) -> Dict[str, Any]:
+@grouped_cached(cache=Cache.REDIS, ttl=3600,
+    key_builder=lambda f, session, user_id, farm_id:
+    gen_user_key(user_id, "stats", "plots", "farm", farm_id, "area"),
+    skip_cache_func=lambda result: result["status"] != "success"
+)
+async def calculate_total_plot_area_by_farm(
+        session: AsyncSession,
+        user_id: str,  # farm owner; also keys the cache
+        farm_id: str
+) -> Dict[str, Any]:
     try:
-        # Get farm first to validate it exists
-        farm_query = select(Farm).filter(Farm.uuid == farm_id)
-        farm_result = await session.execute(farm_query)
-        farm = farm_result.scalar_one_or_none()
-        
-        if not farm:
+        # Farm ownership and the sum in one query: no row means the farm is
+        # missing or not the caller's
+        query = select(
+            select(func.coalesce(func.sum(Plot.area_sqm), 0.0))
+            .filter(Plot.farm_id == Farm.uuid)
+            .scalar_subquery()
+        ).filter(Farm.uuid == farm_id, Farm.owner_id == user_id)
+        result = await session.execute(query)
+        total_area = result.scalar_one_or_none()
+
+        if total_area is None:
             return {
                 "status": "error",
                 "data": None,
-                "error": "Farm not found"
+                "error": "Farm not found or access denied"
             }
 
-        query = select(func.sum(Plot.area_sqm)).filter(Plot.farm_id == farm.uuid)
-        result = await session.execute(query)
-        total_area = result.scalar()
-
         return {
             "status": "success",
-            "data": {"total_area_sqm": total_area or 0.0},
+            "data": {"total_area_sqm": total_area},
             "error": None
         }
 
@@ -773,48 +896,30 @@ async def calculate_total_plot_area_by_farm(session: AsyncSession, farm_id: str)
         }
 
 
+@grouped_cached(cache=Cache.REDIS, ttl=3600,
+    key_builder=lambda f, session, requester_id, user_id=None, farm_id=None:
+    gen_user_key(requester_id, "stats", "plots", gen_query_hash({"farm_id": farm_id})),
+    skip_cache_func=lambda result: result["status"] != "success"
+)
 async def get_plot_statistics(
-        session: AsyncSession, 
+        session: AsyncSession,
+        requester_id: str,  # plots are scoped to this user; also keys the cache
         user_id: Optional[str] = None,
         farm_id: Optional[str] = None
 ) -> Dict[str, Any]:
     try:
-        count_query = select(func.count(Plot.id))
-
-        if farm_id:
-            # Get farm first to validate it exists
-            farm_query = select(Farm).filter(Farm.uuid == farm_id)
-            farm_result = await session.execute(farm_query)
-            farm = farm_result.scalar_one_or_none()
-            
-            if not farm:
-                return {
-                    "status": "error",
-                    "data": None,
-                    "error": "Farm not found"
-                }
-            count_query = count_query.filter(Plot.farm_id == farm.uuid)
-        elif user_id:
-            count_query = count_query.join(Farm).filter(Farm.owner_id == user_id)
-
-        count_result = await session.execute(count_query)
-        total_plots = count_result.scalar()
-
-        if total_plots == 0:
+        # Statistics only cover the requester's own plots, so the cached
+        # entry lives in the namespace their plot writes invalidate
+        if user_id is not None and user_id != requester_id:
             return {
-                "status": "success",
-                "data": {
-                    'total_plots': 0,
-                    'total_area_sqm': 0,
-                    'total_area_hectares': 0,
-                    'average_area_sqm': 0,
-                    'smallest_plot_sqm': 0,
-                    'largest_plot_sqm': 0
-                },
-                "error": None
+                "status": "error",
+                "data": None,
+                "error": "Access denied"
             }
 
+        # Count and area aggregates come from a single scan
         stats_query = select(
+            func.count(Plot.id).label('total_plots'),
             func.sum(Plot.area_sqm).label('total_area'),
             func.avg(Plot.area_sqm).label('avg_area'),
             func.min(Plot.area_sqm).label('min_area'),
@@ -822,17 +927,29 @@ async def get_plot_statistics(
         )
 
         if farm_id:
-            stats_query = stats_query.filter(Plot.farm_id == farm.uuid)
-        elif user_id:
-            stats_query = stats_query.join(Farm).filter(Farm.owner_id == user_id)
+            # Aggregate from the farm side so a missing farm yields no row
+            stats_query = stats_query.select_from(Farm).outerjoin(
+                Plot, Plot.farm_id == Farm.uuid
+            ).filter(
+                Farm.uuid == farm_id, Farm.owner_id == requester_id
+            ).group_by(Farm.id)
+        else:
+            stats_query = stats_query.join(Farm).filter(Farm.owner_id == requester_id)
 
         stats_result = await session.execute(stats_query)
         result = stats_result.first()
 
+        if result is None:
+            return {
+                "status": "error",
+                "data": None,
+                "error": "Farm not found or access denied"
+            }
+
         return {
             "status": "success",
             "data": {
-                'total_plots': total_plots,
+                'total_plots': result.total_plots,
                 'total_area_sqm': float(result.total_area or 0),
                 'total_area_hectares': float(result.total_area or 0) / 10000,
                 'average_area_sqm': float(result.avg_area or 0),
@@ -850,20 +967,18 @@ async def get_plot_statistics(
         }
 
 
-async def get_plot_boundary_as_geojson(session: AsyncSession, plot_id: int) -> Optional[Dict]:
-    query = select(func.ST_AsGeoJSON(Plot.boundary)).filter(Plot.id == plot_id)
-    result = await session.execute(query)
-    geojson = result.scalar()
-
-    return json.loads(geojson) if geojson else None
+async def get_plot_geojson(session: AsyncSession, plot_id: int) -> Tuple[Optional[Dict], Optional[Dict]]:
+    """Return (boundary, centroid) GeoJSON for a plot in one round-trip"""
+    result = await session.execute(PLOT_GEOJSON_BY_ID, {'plot_id': plot_id})
+    row = result.one_or_none()
+    if row is None:
+        return None, None
 
-
-async def get_plot_centroid_as_geojson(session: AsyncSession, plot_id: int) -> Optional[Dict]:
-    query = select(func.ST_AsGeoJSON(Plot.centroid)).filter(Plot.id == plot_id)
-    result = await session.execute(query)
-    geojson = result.scalar()
-
-    return json.loads(geojson) if geojson else None
+    boundary, centroid = row
+    return (
+        json.loads(boundary) if boundary else None,
+        json.loads(centroid) if centroid else None
+    )
 
 
 def validate_plot_geojson_polygon(geojson_data: Dict[str, Any]) -> bool:
@@ -881,9 +996,7 @@ def validate_plot_geojson_polygon(geojson_data: Dict[str, Any]) -> bool:
         if len(coords[0]) < 4:
             return False
 
-        polygon = shape(geojson_data)
-
-        return polygon.is_valid
+        return geojson_to_polygon(geojson_data).is_valid
 
     except Exception:
         return False
@@ -897,12 +1010,9 @@ async def get_plot_with_type_data(
     """Get a plot with its plot type data specifically"""
     try:
         # Join with farm to check ownership
-        query = select(Plot).join(Farm).filter(
-            Plot.uuid == plot_id,
-            Farm.owner_id == user["uuid"]
+        result = await session.execute(
+            OWNED_PLOT_BY_UUID, {'plot_id': plot_id, 'owner_id': user["uuid"]}
         )
-
-        result = await session.execute(query)
         plot = result.scalar_one_or_none()
 
         if not plot:
@@ -947,11 +1057,9 @@ async def update_plot_type_data_only(
     """Update only the plot type data for a plot"""
     try:
         # Join with farm to check ownership
-        query = select(Plot).join(Farm).filter(
-            Plot.uuid == plot_id,
-            Farm.owner_id == user["uuid"]
+        result = await session.execute(
+            OWNED_PLOT_BY_UUID, {'plot_id': plot_id, 'owner_id': user["uuid"]}
         )
-        result = await session.execute(query)
         plot = result.scalar_one_or_none()
 
         if not plot:
@@ -978,17 +1086,12 @@ async def update_plot_type_data_only(
             plot.update_timestamp()
 
         await session.commit()
-        await session.refresh(plot)
-
-        # Get farm for cache invalidation
-        farm_query = select(Farm).filter(Farm.uuid == plot.farm_id)
-        farm_result = await session.execute(farm_query)
-        farm = farm_result.scalar_one()
 
         # Invalidate relevant caches
         await invalidate_patterns(user['uuid'], [
-            f"plots:farm:{farm.uuid}:*",
-            f"plots:user:*",
+            f"plots:farm:{plot.farm_id}:*",
+            "plots:user_list:*",
+            "plots:type:*",
             "dashboard",
             "stats:*"
         ])
@@ -1,9 +1,19 @@
-import datetime
+from fastapi.concurrency import run_in_threadpool
+
 from models import user
 import auth
+from sqlalchemy import bindparam, func, or_
 from sqlalchemy.future import select
 from services.validators import validate_user_data
 
+# Lookups built once at import; callers bind the parameters
+USER_BY_USERNAME = select(user.User).where(user.User.username == bindparam('login'))
+USER_BY_EMAIL = select(user.User).where(user.User.email == bindparam('login'))
+USER_BY_UUID = select(user.User).where(user.User.uuid == bindparam('uuid'))
+USER_BY_GOOGLE_ID_OR_EMAIL = select(user.User).where(
+    or_(user.User.google_id == bindparam('google_id'), user.User.email == bindparam('email'))
+)
+
 async def create_user(data, session) -> dict:
     try:
         validated = validate_user_data(data)
@@ -25,10 +35,12 @@ async def create_user(data, session) -> dict:
             timezone=data.get('timezone', 'UTC'),
             language=data.get('language', 'en'),
             theme=data.get('theme', 'light'),
-            password=data.get('password', ''),
             # role=data.get('role', 'user'),
         )
-        new_user.set_password(data['password'])
+        # Password hashing is deliberately slow; keep it off the event loop.
+        # The password is not passed to the constructor, which would hash it
+        # a second time on the loop.
+        await run_in_threadpool(new_user.set_password, data['password'])
         session.add(new_user)
         await session.commit()
         return {
@@ -45,21 +57,21 @@ async def login_user(data, session) -> dict:
             return {"status": "error", "message": "Username and password are required"}
         data['username'] = data['username'].strip()
         data['password'] = data['password'].strip()
-        user_instance = select(user.User).where(
-            (user.User.username == data['username']) |
-            (user.User.email == data['username'])
-        )
-        result = await session.execute(user_instance)
+        # Validated usernames cannot contain '@', so the login names exactly
+        # one unique column and the lookup is a single index probe
+        login_query = USER_BY_EMAIL if '@' in data['username'] else USER_BY_USERNAME
+        result = await session.execute(login_query, {'login': data['username']})
         user_instance = result.scalar_one_or_none()
         if not user_instance:
             return {"status": "error", "message": "User not found"}
-        if not user_instance.check_password(data['password']):
+        if not await run_in_threadpool(user_instance.check_password, data['password']):
             user_instance.increment_failed_login()
             return {"status": "error", "message": "Incorrect password"}
 
-        user_instance.last_login = datetime.datetime.now()
+        # Stamped by the database in the UPDATE, in the column's timezone
+        user_instance.last_login = func.now()
         user_instance.first_login = False
-        token = auth.create_JWT(user_instance.to_dict())
+        token = auth.create_JWT(user_instance.jwt_claims())
 
         await session.commit()
 
@@ -87,12 +99,11 @@ async def get_user(user_id, session) -> dict:
 
 async def get_user_from_token(token, session) -> dict:
     try:
-        decoded = auth.decodeJWT(token)
+        decoded = auth.decodeJWT_cached(token)
         if decoded == "Invalid":
             return {"status": "error", "message": "Invalid token"}
         
-        stmt = select(user.User).where(user.User.uuid == decoded['user_id'])
-        user_instance = await session.execute(stmt)
+        user_instance = await session.execute(USER_BY_UUID, {'uuid': decoded['user_id']})
         user_instance = user_instance.scalar_one_or_none()
         if not user_instance:
             return {"status": "error", "message": "Invalid token"}
@@ -115,13 +126,19 @@ async def google_signup(data, session) -> dict:
             if not data.get(field):
                 return {"status": "error", "message": f"{field} is required"}
         
-        existing_google_user = select(user.User).where(user.User.google_id == data['sub'])
-        result = await session.execute(existing_google_user)
-        existing_google_user = result.scalar_one_or_none()
+        # One lookup for both matches; at most one row each, since google_id
+        # and email are unique
+        result = await session.execute(
+            USER_BY_GOOGLE_ID_OR_EMAIL, {'google_id': data['sub'], 'email': data['email']}
+        )
+        existing_users = result.scalars().all()
+        existing_google_user = next((u for u in existing_users if u.google_id == data['sub']), None)
+        existing_email_user = next((u for u in existing_users if u.email == data['email']), None)
+
         if existing_google_user:
             existing_google_user.update_last_login()
             # existing_google_user.se
-            token = auth.create_JWT(existing_google_user.to_dict())
+            token = auth.create_JWT(existing_google_user.jwt_claims())
             await session.commit()
             return {
                 "status": "success",
@@ -129,9 +146,6 @@ async def google_signup(data, session) -> dict:
                 "data": token
             }
 
-        existing_email_user = select(user.User).where(user.User.email == data['email'])
-        result = await session.execute(existing_email_user)
-        existing_email_user = result.scalar_one_or_none()
         if existing_email_user:
             if existing_email_user.google_id:
                 return {"status": "error", "message": "Email already associated with another Google account"}
@@ -144,7 +158,7 @@ async def google_signup(data, session) -> dict:
                     existing_email_user.login_type = user.LoginType.BOTH
                 else:
                     existing_email_user.login_type = user.LoginType.GOOGLE_AUTH
-                token = auth.create_JWT(existing_email_user.to_dict())
+                token = auth.create_JWT(existing_email_user.jwt_claims())
                 await session.commit()
                 return {
                     "status": "success",
@@ -175,10 +189,11 @@ async def google_signup(data, session) -> dict:
         #     new_user.full_name = f"{new_user.first_name} {new_user.last_name}"
         
         session.add(new_user)
-        token = auth.create_JWT(new_user.to_dict())
-
         await session.commit()
 
+        # uuid and role are column defaults, only set once the row is flushed
+        token = auth.create_JWT(new_user.jwt_claims())
+
         return {
             "status": "success",
             "message": "User created via Google signup",
@@ -13,8 +13,11 @@ def jwt_required(permission_level):
             if not auth_header:
                 return JSONResponse({'message': 'Incorrect credentials'}, status_code=401)
 
-            auth_token = auth_header.split(" ")[1]
-            decoded_token = auth.decodeJWT(auth_token)
+            _, _, auth_token = auth_header.partition(" ")
+            if not auth_token:
+                return JSONResponse({'message': 'Incorrect credentials'}, status_code=401)
+
+            decoded_token = auth.decodeJWT_cached(auth_token)
             if decoded_token == "Invalid":
                 return JSONResponse({'message': 'Incorrect credentials'}, status_code=401)
             role = decoded_token['role']
@@ -36,8 +39,11 @@ def jwt_required_with_id(permission_level):
             if not auth_header:
                 return JSONResponse({'message': 'Incorrect credentials'}, status_code=401)
 
-            auth_token = auth_header.split(" ")[1]
-            decoded_token = auth.decodeJWT(auth_token)
+            _, _, auth_token = auth_header.partition(" ")
+            if not auth_token:
+                return JSONResponse({'message': 'Incorrect credentials'}, status_code=401)
+
+            decoded_token = auth.decodeJWT_cached(auth_token)
             if decoded_token == "Invalid":
                 return JSONResponse({'message': 'Incorrect credentials'}, status_code=401)
             role = decoded_token['role']
@@ -51,3 +57,28 @@ def jwt_required_with_id(permission_level):
 
     return decorator
 
+
+
+def handle_controller_errors(rollback: bool = False):
+    """Turn uncaught controller exceptions into the standard error response.
+
+    Writers pass rollback=True so the session is rolled back first; readers
+    have nothing to undo and skip that round-trip.
+    """
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(session, *args, **kwargs):
+            try:
+                return await func(session, *args, **kwargs)
+            except Exception as e:
+                if rollback:
+                    await session.rollback()
+                return {
+                    "status": "error",
+                    "data": None,
+                    "error": str(e)
+                }
+
+        return wrapper
+
+    return decorator
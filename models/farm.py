@@ -1,5 +1,6 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Float
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Float, CheckConstraint, DDL, Index, event
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import relationship, deferred
 from geoalchemy2 import Geography
 import uuid
 from datetime import datetime
@@ -15,10 +16,16 @@ class Farm(Base):
     name = Column(String(255), nullable=False)
     owner_id = Column(String(36), ForeignKey('users.uuid'), nullable=False)
 
-    boundary = Column(Geography('POLYGON', srid=4326), nullable=False)
+    # Geometry is only used inside SQL expressions, never read back into Python,
+    # so it is deferred to keep WKB out of SELECT and RETURNING column lists
+    boundary = deferred(Column(Geography('POLYGON', srid=4326), nullable=False), group='geometry')
 
     # Optional: Store centroid for quick location queries
-    centroid = Column(Geography('POINT', srid=4326))
+    centroid = deferred(Column(Geography('POINT', srid=4326)), group='geometry')
+
+    # GeoJSON copies of boundary/centroid, kept in sync by the farms_sync_geojson trigger
+    boundary_geojson = deferred(Column(JSONB), group='geojson')
+    centroid_geojson = deferred(Column(JSONB), group='geojson')
 
     # Metadata
     created_at = Column(DateTime, default=datetime.utcnow)
@@ -32,6 +39,14 @@ class Farm(Base):
     plots = relationship("Plot", back_populates="farm", cascade="all, delete-orphan")
     owner = relationship("User", back_populates="farms")
 
+    # Polygon validity is checked by PostGIS on write instead of by Shapely in
+    # the request handler, keeping the GEOS work off the event loop
+    __table_args__ = (
+        CheckConstraint('ST_IsValid(boundary::geometry)', name='ck_farm_boundary_valid'),
+        # Every per-owner listing, count and area sum filters on owner_id
+        Index('idx_farms_owner_id', 'owner_id', postgresql_include=['area_sqm']),
+    )
+
     def __init__(self, name, owner_id, **kwargs):
         self.name = name
         self.owner_id = owner_id
@@ -58,10 +73,8 @@ class Farm(Base):
             'updated_at': self.updated_at.isoformat() if self.updated_at else None,
         }
 
-        if include_geometry and hasattr(self, 'boundary_geojson'):
+        if include_geometry:
             farm_dict['boundary'] = self.boundary_geojson
-
-        if include_geometry and hasattr(self, 'centroid_geojson'):
             farm_dict['centroid'] = self.centroid_geojson
 
         return farm_dict
@@ -84,4 +97,22 @@ class Farm(Base):
 
     def update_timestamp(self):
         """Update the updated_at timestamp."""
-        self.updated_at = datetime.utcnow()
\ No newline at end of file
+        self.updated_at = datetime.utcnow()
+
+
+# Keep boundary_geojson/centroid_geojson in sync with the geometry columns so
+# reads never have to run ST_AsGeoJSON. Mirrors the migration for create_all().
+event.listen(Farm.__table__, 'after_create', DDL("""
+CREATE OR REPLACE FUNCTION farms_sync_geojson() RETURNS trigger AS $$
+BEGIN
+    NEW.boundary_geojson := ST_AsGeoJSON(NEW.boundary)::jsonb;
+    NEW.centroid_geojson := ST_AsGeoJSON(NEW.centroid)::jsonb;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql
+"""))
+event.listen(Farm.__table__, 'after_create', DDL("""
+CREATE TRIGGER farms_sync_geojson
+BEFORE INSERT OR UPDATE OF boundary, centroid ON farms
+FOR EACH ROW EXECUTE FUNCTION farms_sync_geojson()
+"""))
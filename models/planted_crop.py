@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Text, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import uuid
@@ -41,6 +41,15 @@ class PlantedCrop(Base):
     plot = relationship("Plot", backref="planted_crops")
     user = relationship("User", backref="planted_crops")
 
+    # Every listing is scoped to the owner; newest-first paging and the
+    # per-plot filter are served straight from these
+    __table_args__ = (
+        Index('idx_planted_crop_user_created', 'user_id', created_at.desc()),
+        Index('idx_planted_crop_user_plot', 'user_id', 'plot_id'),
+        # Lets the statistics totals be answered by an index-only scan
+        Index('idx_planted_crop_user_totals', 'user_id', postgresql_include=['estimated_yield', 'number_of_crops']),
+    )
+
     def __init__(self, crop_id, plot_id, user_id, **kwargs):
         self.crop_id = crop_id
         self.plot_id = plot_id
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, Text, ForeignKey, Enum
+from sqlalchemy import Column, Computed, Integer, String, Float, DateTime, Text, ForeignKey, Enum, Index
 from sqlalchemy.orm import relationship
 from geoalchemy2 import Geography
 from datetime import datetime
@@ -51,8 +51,8 @@ class Plot(Base):
     boundary = Column(Geography('POLYGON', srid=4326), nullable=False)
     centroid = Column(Geography('POINT', srid=4326))
 
-    # Area and measurements
-    area_sqm = Column(Float)
+    # Area and measurements; derived from boundary by PostgreSQL
+    area_sqm = Column(Float, Computed('ST_Area(boundary)', persisted=True))
 
     # Notes and metadata
     notes = Column(Text)
@@ -62,6 +62,15 @@ class Plot(Base):
     # Relationships
     farm = relationship("Farm", back_populates="plots")
 
+    # area_sqm is generated by PostgreSQL; fetch it with RETURNING on every
+    # flush instead of expiring it, which would lazy-load in an AsyncSession
+    __mapper_args__ = {'eager_defaults': True}
+
+    __table_args__ = (
+        # Per-farm listings filter on farm_id; get_plots_by_type adds plot_type
+        Index('idx_plots_farm_id_plot_type', 'farm_id', 'plot_type'),
+    )
+
     def __init__(self, name, farm_id, plot_type=PlotType.FIELD, **kwargs):
         self.name = name
         self.farm_id = farm_id
@@ -12,7 +12,7 @@ class PlotTypeBase(Base):
     
     id = Column(Integer, primary_key=True, index=True)
     uuid = Column(String(36), unique=True, index=True, default=lambda: str(uuid.uuid4()))
-    plot_id = Column(String(36), ForeignKey('plots.uuid'), nullable=False)
+    plot_id = Column(String(36), ForeignKey('plots.uuid'), nullable=False, index=True)
     name = Column(String(255), nullable=False)
     notes = Column(Text, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
@@ -213,4 +213,12 @@ PLOT_TYPE_MODELS = {
     "residence": ResidencePlotType,
     "natural-area": NaturalAreaPlotType,
     "water-source": WaterSourcePlotType
-}
\ No newline at end of file
+}
+
+# Columns a client may set on each plot type model; identity, ownership and
+# timestamp columns are managed by the server
+PLOT_TYPE_SETTABLE_COLUMNS = {
+    plot_type: frozenset(column.name for column in model.__table__.columns)
+    - {'plot_id', 'id', 'uuid', 'created_at', 'updated_at'}
+    for plot_type, model in PLOT_TYPE_MODELS.items()
+}
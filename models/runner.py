@@ -1,4 +1,6 @@
 import os
+from uuid import uuid4
+
 import dotenv
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.ext.asyncio import async_sessionmaker
@@ -13,10 +15,32 @@ host = os.getenv('DB_HOST')
 
 database_uri = f"postgresql+asyncpg://{db_user}:{password}@{host}/{database}"
 
+# Behind PgBouncer in transaction pooling mode asyncpg must not cache
+# prepared statements, and their names must be unique across the server
+# connections PgBouncer hands out
+behind_pgbouncer = os.getenv('DB_PGBOUNCER', '').lower() in ('1', 'true', 'yes')
+statement_cache_size = int(os.getenv('DB_STATEMENT_CACHE_SIZE', 0 if behind_pgbouncer else 1024))
+
+connect_args = {
+    "statement_cache_size": statement_cache_size,
+    "prepared_statement_cache_size": statement_cache_size
+}
+if behind_pgbouncer:
+    connect_args["prepared_statement_name_func"] = lambda: f"__asyncpg_{uuid4()}__"
+
 engine = create_async_engine(
     database_uri,
     # echo=True,  # Set to True for debugging purposes
-    future=True  # Use future mode for SQLAlchemy 2.0 compatibility
+    future=True,  # Use future mode for SQLAlchemy 2.0 compatibility
+    pool_size=int(os.getenv('DB_POOL_SIZE', 25)),
+    max_overflow=int(os.getenv('DB_MAX_OVERFLOW', 25)),
+    pool_pre_ping=True,  # Drop connections the server or a proxy has closed
+    pool_recycle=1800,
+    # Give up on a pool checkout after this many seconds (SQLAlchemy waits 30
+    # by default) so an exhausted pool surfaces as errors quickly
+    pool_timeout=float(os.getenv('DB_POOL_TIMEOUT', 10)),
+    pool_use_lifo=True,  # Reuse warm connections, let idle ones age out
+    connect_args=connect_args
 )
 
 async_session = async_sessionmaker(
@@ -176,6 +176,10 @@ class User(Base):
         """Get the UUID of the user."""
         return self.uuid
 
+    def jwt_claims(self):
+        """Return only the fields auth.create_JWT reads."""
+        return {'uuid': self.uuid, 'role': self.role}
+
     def to_dict(self, include_sensitive=False):
         """Convert user object to dictionary."""
         user_dict = {
@@ -1,6 +1,7 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Request, Depends, HTTPException
+from fastapi import APIRouter, Request, Depends, HTTPException, Response
+from fastapi.responses import StreamingResponse
 from fastapi.security import HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -61,21 +62,67 @@ async def get_all_farms(
         session=session,
         skip=data.get('skip', 0),
         limit=data.get('limit', 100),
-        include_geojson=data.get('include_geojson', False)
+        include_geojson=data.get('include_geojson', False),
+        bbox=data.get('bbox'),
+        simplify_tolerance=data.get('simplify_tolerance', 0.0),
+        geometry=data.get('geometry', 'boundary')
     )
 
 
 @router.post("/get_user_farms", response_model=None)
 async def get_user_farms(
+        request: Request,
         user: Annotated[dict, Depends(get_current_user)],
         session: AsyncSession = Depends(runner.get_db_session),
 ):
+    # The body is optional: existing clients post without one
+    data = await request.json() if await request.body() else {}
     return await farm_controller.get_farms_by_owner(
         session=session,
-        user_id=user['uuid']
+        user_id=user['uuid'],
+        bbox=data.get('bbox'),
+        simplify_tolerance=data.get('simplify_tolerance', 0.0),
+        geometry=data.get('geometry', 'boundary')
     )
 
 
+@router.post("/get_user_farms_geojson", response_model=None)
+async def get_user_farms_geojson(
+        request: Request,
+        user: Annotated[dict, Depends(get_current_user)],
+        session: AsyncSession = Depends(runner.get_db_session),
+):
+    data = await request.json()
+    result = await farm_controller.get_farms_as_featurecollection(
+        session=session,
+        owner_id=user['uuid'],
+        skip=data.get('skip', 0),
+        limit=data.get('limit', 100)
+    )
+    if result['status'] != "success":
+        return result
+
+    # Already serialised by PostgreSQL, pass it through untouched
+    return Response(content=result['data'], media_type="application/geo+json")
+
+
+@router.post("/stream_user_farms", response_model=None)
+async def stream_user_farms(
+        user: Annotated[dict, Depends(get_current_user)],
+):
+    # The body outlives this handler, so it opens its own session rather
+    # than borrowing the request-scoped one
+    async def body():
+        async with runner.async_session() as session:
+            async for chunk in farm_controller.stream_farms_as_featurecollection(
+                session=session,
+                owner_id=user['uuid']
+            ):
+                yield chunk
+
+    return StreamingResponse(body(), media_type="application/geo+json")
+
+
 @router.post("/update_farm", response_model=None)
 async def update_farm(
         request: Request,
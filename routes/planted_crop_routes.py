@@ -1,6 +1,7 @@
 from typing import Annotated
 
 from fastapi import APIRouter, Request, Depends, HTTPException
+from fastapi.responses import JSONResponse
 from fastapi.security import HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -15,6 +16,9 @@ router = APIRouter(
 
 security = HTTPBearer()
 
+# Controllers return plain JSON-ready dicts (dates already ISO strings), so
+# responses are wrapped in JSONResponse to skip FastAPI's jsonable_encoder walk
+
 
 @router.post("/create", response_model=None)
 async def create_planted_crop(
@@ -25,11 +29,12 @@ async def create_planted_crop(
     """Create a new planted crop (Authenticated users)"""
     data = await request.json()
     # Note: crop_id and plot_id in request body are UUIDs
-    return await planted_crop_controller.create_planted_crop(
+    result = await planted_crop_controller.create_planted_crop(
         session=session,
         user_uuid=user['uuid'],
         data=data
     )
+    return JSONResponse(result)
 
 
 @router.post("/get", response_model=None)
@@ -45,11 +50,12 @@ async def get_planted_crop(
     except KeyError:
         raise HTTPException(status_code=400, detail="planted_crop_id is required")
 
-    return await planted_crop_controller.get_planted_crop(
+    result = await planted_crop_controller.get_planted_crop(
         session=session,
         user_uuid=user['uuid'],
         planted_crop_uuid=planted_crop_uuid
     )
+    return JSONResponse(result)
 
 
 @router.post("/get_all", response_model=None)
@@ -61,7 +67,7 @@ async def get_all_planted_crops(
     """Get all planted crops with optional filtering (Authenticated users)"""
     data = await request.json()
     # Note: plot_id and crop_id in request body are UUIDs
-    return await planted_crop_controller.get_all_planted_crops(
+    result = await planted_crop_controller.get_all_planted_crops(
         session=session,
         user_uuid=user['uuid'],
         skip=data.get('skip', 0),
@@ -69,6 +75,7 @@ async def get_all_planted_crops(
         plot_uuid=data.get('plot_id'),
         crop_uuid=data.get('crop_id')
     )
+    return JSONResponse(result)
 
 
 @router.post("/get_with_details", response_model=None)
@@ -80,13 +87,14 @@ async def get_planted_crops_with_details(
     """Get planted crops with crop, plot, and user details (Authenticated users)"""
     data = await request.json()
     # Note: plot_id in request body is UUID
-    return await planted_crop_controller.get_planted_crops_with_details(
+    result = await planted_crop_controller.get_planted_crops_with_details(
         session=session,
         user_uuid=user['uuid'],
         skip=data.get('skip', 0),
         limit=data.get('limit', 100),
         plot_uuid=data.get('plot_id')
     )
+    return JSONResponse(result)
 
 
 @router.post("/update", response_model=None)
@@ -105,12 +113,13 @@ async def update_planted_crop(
     # Remove planted_crop_id from data before passing to controller
     update_data = {k: v for k, v in data.items() if k != 'planted_crop_id'}
 
-    return await planted_crop_controller.update_planted_crop(
+    result = await planted_crop_controller.update_planted_crop(
         session=session,
         user_uuid=user['uuid'],
         planted_crop_uuid=planted_crop_uuid,
         data=update_data
     )
+    return JSONResponse(result)
 
 
 @router.post("/delete", response_model=None)
@@ -126,11 +135,12 @@ async def delete_planted_crop(
     except KeyError:
         raise HTTPException(status_code=400, detail="planted_crop_id is required")
 
-    return await planted_crop_controller.delete_planted_crop(
+    result = await planted_crop_controller.delete_planted_crop(
         session=session,
         user_uuid=user['uuid'],
         planted_crop_uuid=planted_crop_uuid
     )
+    return JSONResponse(result)
 
 
 @router.post("/count", response_model=None)
@@ -142,12 +152,13 @@ async def count_planted_crops(
     """Count planted crops with optional filtering (Authenticated users)"""
     data = await request.json()
     # Note: plot_id and crop_id in request body are UUIDs
-    return await planted_crop_controller.count_planted_crops(
+    result = await planted_crop_controller.count_planted_crops(
         session=session,
         user_uuid=user['uuid'],
         plot_uuid=data.get('plot_id'),
         crop_uuid=data.get('crop_id')
     )
+    return JSONResponse(result)
 
 
 @router.post("/statistics", response_model=None)
@@ -157,7 +168,8 @@ async def get_planted_crop_statistics(
         session: AsyncSession = Depends(runner.get_db_session),
 ):
     """Get statistics about planted crops (Authenticated users)"""
-    return await planted_crop_controller.get_planted_crop_statistics(
+    result = await planted_crop_controller.get_planted_crop_statistics(
         session=session,
         user_uuid=user['uuid']
     )
+    return JSONResponse(result)
@@ -1,6 +1,7 @@
 from typing import Annotated
 
 from fastapi import APIRouter, Request, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 from fastapi.security import HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -88,6 +89,27 @@ async def get_user_plots(
     )
 
 
+@router.post("/stream_user_plots", response_model=None)
+async def stream_user_plots(
+        request: Request,
+        user: Annotated[dict, Depends(get_current_user)],
+):
+    data = await request.json()
+
+    # The body outlives this handler, so it opens its own session rather
+    # than borrowing the request-scoped one
+    async def body():
+        async with runner.async_session() as session:
+            async for chunk in plot_controller.stream_plots_as_featurecollection(
+                session=session,
+                owner_id=user['uuid'],
+                farm_id=data.get('farm_id')
+            ):
+                yield chunk
+
+    return StreamingResponse(body(), media_type="application/geo+json")
+
+
 @router.post("/get_plots_by_type", response_model=None)
 async def get_plots_by_type(
         request: Request,
@@ -168,6 +190,7 @@ async def count_plots_by_farm(
 
     return await plot_controller.count_plots_by_farm(
         session=session,
+        user_id=user["uuid"],
         farm_id=farm_id
     )
 
@@ -186,6 +209,7 @@ async def get_plot_area_by_farm(
 
     return await plot_controller.calculate_total_plot_area_by_farm(
         session=session,
+        user_id=user["uuid"],
         farm_id=farm_id
     )
 
@@ -199,6 +223,7 @@ async def get_plot_stats(
     data = await request.json()
     return await plot_controller.get_plot_statistics(
         session=session,
+        requester_id=user["uuid"],
         user_id=data.get('user_id'),
         farm_id=data.get('farm_id')
     )
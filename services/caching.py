@@ -1,8 +1,11 @@
 from typing import List, Optional
+import logging
 
-from aiocache import caches, Cache, RedisCache
+from aiocache import caches, cached, Cache, RedisCache
 import hashlib
 
+logger = logging.getLogger(__name__)
+
 caches.set_config({
     'default': {
         'cache': "aiocache.RedisCache",
@@ -27,23 +30,123 @@ def gen_query_hash(filters: dict) -> str:
         str(sorted(filters.items())).encode()
     ).hexdigest()[:8]
 
+GROUP_PREFIX = "grp:"
+
+
+def key_groups(key: str) -> List[str]:
+    """Group sets a cache key belongs to: one per ':'-separated prefix.
+
+    u:<id>:plots:farm:<farm>:<hash> is indexed under u:<id>, u:<id>:plots,
+    u:<id>:plots:farm and u:<id>:plots:farm:<farm>, so invalidating the
+    pattern plots:farm:<farm>:* only needs that one set.
+    """
+    parts = key.split(":")
+    return [GROUP_PREFIX + ":".join(parts[:i]) for i in range(2, len(parts))]
+
+
+# Writes a cached value and adds its key to each group set in one server-side
+# call. A group's TTL is raised to cover the newest member, so a group lives as
+# long as its longest-lived key; a key without a TTL makes its groups
+# persistent. Uses only SET/SADD/TTL/EXPIRE/PERSIST, so it runs on any Redis
+# with scripting rather than needing Redis 7's EXPIRE NX/GT.
+# KEYS[1]: cache key, KEYS[2..]: group sets; ARGV[1]: value, ARGV[2]: ttl (0 = none)
+SET_GROUPED_SCRIPT = """
+local ttl = tonumber(ARGV[2])
+if ttl > 0 then
+    redis.call("SET", KEYS[1], ARGV[1], "EX", ttl)
+else
+    redis.call("SET", KEYS[1], ARGV[1])
+end
+for i = 2, #KEYS do
+    local existed = redis.call("EXISTS", KEYS[i])
+    redis.call("SADD", KEYS[i], KEYS[1])
+    if ttl == 0 then
+        redis.call("PERSIST", KEYS[i])
+    else
+        local remaining = redis.call("TTL", KEYS[i])
+        if existed == 0 or (remaining >= 0 and remaining < ttl) then
+            redis.call("EXPIRE", KEYS[i], ttl)
+        end
+    end
+end
+return 1
+"""
+
+
+class grouped_cached(cached):
+    """``cached`` that also records each key in its prefix group sets.
+
+    The value and its group memberships are written by SET_GROUPED_SCRIPT in
+    one call, which lets invalidate_patterns find keys without scanning the
+    keyspace; group sets expire along with their members.
+    """
+
+    async def set_in_cache(self, key, value):
+        try:
+            client = self.cache.client
+            ttl = self.ttl if isinstance(self.ttl, int) else 0
+            await client.register_script(SET_GROUPED_SCRIPT)(
+                keys=[key, *key_groups(key)],
+                args=[self.cache.serializer.dumps(value), ttl]
+            )
+        except Exception:
+            logger.exception("Couldn't set %s in key %s, unexpected error", value, key)
+
+
+# Drops every member of the given group sets, the sets themselves and any
+# exact keys, in one server-side call
+INVALIDATE_GROUPS_SCRIPT = """
+local deleted = 0
+for _, name in ipairs(ARGV) do
+    if string.sub(name, 1, 4) == "grp:" then
+        local members = redis.call("SMEMBERS", name)
+        for i = 1, #members, 1000 do
+            deleted = deleted + redis.call("UNLINK", unpack(members, i, math.min(i + 999, #members)))
+        end
+    end
+    deleted = deleted + redis.call("UNLINK", name)
+end
+return deleted
+"""
+
+# Fallback for patterns that are not a plain "prefix:*": SCAN + UNLINK
+INVALIDATE_PATTERNS_SCRIPT = """
+local deleted = 0
+for _, pattern in ipairs(ARGV) do
+    local cursor = "0"
+    repeat
+        local reply = redis.call("SCAN", cursor, "MATCH", pattern, "COUNT", 1000)
+        cursor = reply[1]
+        if #reply[2] > 0 then
+            deleted = deleted + redis.call("UNLINK", unpack(reply[2]))
+        end
+    until cursor == "0"
+end
+return deleted
+"""
+
 async def invalidate_patterns(user_id: str, patterns: List[str]):
     try:
-        keys_to_delete = []
-
         cache = caches.get('default')
         client = cache.client
 
+        names = []
+        scan_patterns = []
         for pattern in patterns:
             full_pattern = gen_user_key(user_id, pattern)
+            if full_pattern.endswith(":*") and not any(c in full_pattern[:-2] for c in "*?["):
+                names.append(GROUP_PREFIX + full_pattern[:-2])
+            elif any(c in full_pattern for c in "*?["):
+                scan_patterns.append(full_pattern)
+            else:
+                names.append(full_pattern)
 
-            matching = [key async for key in client.scan_iter(match=full_pattern)]
-            keys_to_delete.extend(matching)
-
-        # Bulk delete
-        if keys_to_delete:
-             for key in keys_to_delete:
-                await client.delete(key)
+        # register_script only hashes the source; the call runs EVALSHA and
+        # falls back to EVAL the first time the server hasn't seen it
+        if names:
+            await client.register_script(INVALIDATE_GROUPS_SCRIPT)(args=names)
+        if scan_patterns:
+            await client.register_script(INVALIDATE_PATTERNS_SCRIPT)(args=scan_patterns)
         return True
     except Exception:
         return False
@@ -0,0 +1,77 @@
+"""planted_crop_controller tests that run without PostgreSQL or Redis.
+
+The "User not found" check rides on each endpoint's own query, so a user
+deleted between two requests is reported as missing on the second one.
+"""
+import asyncio
+import types
+import unittest
+from unittest import mock
+
+from controllers import planted_crop_controller
+from services.caching import grouped_cached
+
+
+class RowResult:
+    def __init__(self, row):
+        self.row = row
+
+    def one(self):
+        return self.row
+
+
+class EmptyStream:
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        raise StopAsyncIteration
+
+
+class UserTableSession:
+    """Answers as if the users table holds exactly the UUIDs in self.users."""
+
+    def __init__(self, *users):
+        self.users = set(users)
+        self.statements = []
+
+    def user_found(self, statement):
+        return bool(self.users & set(statement.compile().params.values()))
+
+    async def execute(self, statement, params=None, **kwargs):
+        self.statements.append(statement)
+        return RowResult((0, self.user_found(statement)))
+
+    async def scalar(self, statement, params=None, **kwargs):
+        self.statements.append(statement)
+        return self.user_found(statement)
+
+    async def stream_scalars(self, statement, **kwargs):
+        self.statements.append(statement)
+        return EmptyStream()
+
+
+@mock.patch.object(grouped_cached, "get_from_cache", mock.AsyncMock(return_value=None))
+@mock.patch.object(grouped_cached, "set_in_cache", mock.AsyncMock())
+class UserExistenceTest(unittest.TestCase):
+
+    def test_count_reports_deleted_user_on_next_call(self):
+        session = UserTableSession("user-uuid")
+        first = asyncio.run(planted_crop_controller.count_planted_crops(session, "user-uuid"))
+        session.users.clear()
+        second = asyncio.run(planted_crop_controller.count_planted_crops(session, "user-uuid"))
+
+        self.assertEqual(first["data"], {"count": 0})
+        self.assertEqual(second["error"], "User not found")
+        self.assertEqual(len(session.statements), 2)
+
+    def test_empty_list_checks_user(self):
+        found = asyncio.run(planted_crop_controller.get_all_planted_crops(UserTableSession("user-uuid"), "user-uuid"))
+        missing = asyncio.run(planted_crop_controller.get_all_planted_crops(UserTableSession(), "user-uuid"))
+
+        self.assertEqual(found["data"], [])
+        self.assertEqual(missing["error"], "User not found")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,260 @@
+"""plot_controller tests that run without PostgreSQL or Redis.
+
+update_plot goes through the real ORM flush: the session is a synchronous
+Session on a DB-API stub, wrapped to look like an AsyncSession. SQL is only
+allowed inside the wrapper's execute/commit, so an implicit lazy load after
+commit (MissingGreenlet under asyncpg) fails the test.
+
+The aggregate tests check ownership scoping and that cached entries land in
+the owner's stats group, which plot writes invalidate.
+"""
+import asyncio
+import datetime
+import types
+import unittest
+from unittest import mock
+
+from sqlalchemy import create_engine
+from sqlalchemy.dialects.postgresql.psycopg2 import PGDialect_psycopg2
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from controllers import plot_controller
+from models.plot import Plot, PlotType
+from services.caching import GROUP_PREFIX, gen_user_key, grouped_cached, key_groups
+from models.user import User  # noqa: F401 - resolves Farm.owner
+
+FLOAT8_OID = 701
+STORED_AREA = 1234.5
+
+
+class StubCursor:
+    def __init__(self, connection):
+        self.connection = connection
+        self.description = None
+        self.rowcount = 1
+        self._rows = []
+
+    def execute(self, sql, params=None):
+        if not self.connection.sql_allowed:
+            raise AssertionError(f"implicit SQL outside an awaited call: {sql}")
+        self.connection.statements.append(sql)
+        self.description = None
+        self._rows = []
+        if " RETURNING " in sql:
+            columns = [c.strip().rsplit(".", 1)[-1] for c in sql.split(" RETURNING ")[1].split(",")]
+            self.description = [(c, FLOAT8_OID, None, None, None, None, None) for c in columns]
+            self._rows = [tuple(STORED_AREA if c == "area_sqm" else None for c in columns)]
+
+    def fetchall(self):
+        rows, self._rows = self._rows, []
+        return rows
+
+    def fetchone(self):
+        return self._rows.pop(0) if self._rows else None
+
+    def fetchmany(self, size=None):
+        return self.fetchall()
+
+    def close(self):
+        pass
+
+
+class StubConnection:
+    def __init__(self):
+        self.sql_allowed = False
+        self.statements = []
+        self.notices = []
+
+    def cursor(self, *args, **kwargs):
+        return StubCursor(self)
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def stub_engine(connection):
+    dbapi = types.SimpleNamespace(
+        paramstyle="pyformat", apilevel="2.0", threadsafety=2,
+        __version__="2.9.10 (dt dec pq3 ext lo64)",
+        connect=lambda *args, **kwargs: connection,
+    )
+    for name in ("Error", "Warning", "InterfaceError", "DatabaseError", "DataError",
+                 "OperationalError", "IntegrityError", "InternalError",
+                 "ProgrammingError", "NotSupportedError"):
+        setattr(dbapi, name, Exception)
+
+    with mock.patch.object(PGDialect_psycopg2, "on_connect", lambda self: None):
+        engine = create_engine("postgresql+psycopg2://", module=dbapi, use_native_hstore=False)
+    engine.dialect.initialize = lambda conn: None
+    engine.dialect.server_version_info = (16, 0)
+    engine.dialect.default_schema_name = "public"
+    return engine
+
+
+class ScalarResult:
+    def __init__(self, value):
+        self.value = value
+
+    def scalar_one_or_none(self):
+        return self.value
+
+    def one_or_none(self):
+        return self.value
+
+
+class StubAsyncSession:
+    """Answers the controller's explicit queries; commits through the real ORM."""
+
+    def __init__(self, connection, plot, boundary_area=None):
+        self.connection = connection
+        self.sync_session = Session(stub_engine(connection), expire_on_commit=False)
+        self.sync_session.add(plot)
+        self.plot = plot
+        self.boundary_area = boundary_area
+
+    async def execute(self, statement, params=None, **kwargs):
+        if statement is plot_controller.OWNED_PLOT_BY_UUID:
+            return ScalarResult(self.plot)
+        if statement is plot_controller.PLOT_GEOJSON_BY_ID:
+            return ScalarResult((None, None))
+        # The boundary UPDATE ... RETURNING area_sqm
+        return ScalarResult(self.boundary_area)
+
+    async def commit(self):
+        self.connection.sql_allowed = True
+        try:
+            self.sync_session.commit()
+        finally:
+            self.connection.sql_allowed = False
+
+    async def rollback(self):
+        self.sync_session.rollback()
+
+
+def persistent_plot():
+    plot = Plot(name="North field", farm_id="farm-uuid", plot_type=PlotType.FIELD)
+    plot.id = 1
+    plot.uuid = "plot-uuid"
+    plot.plot_number = "A1"
+    plot.plot_type_id = None
+    plot.boundary = None
+    plot.centroid = None
+    plot.area_sqm = 100.0
+    plot.notes = ""
+    plot.created_at = plot.updated_at = datetime.datetime(2025, 1, 1)
+    make_transient_to_detached(plot)
+    return plot
+
+
+@mock.patch.object(plot_controller, "invalidate_patterns", mock.AsyncMock(return_value=True))
+class UpdatePlotResponseTest(unittest.TestCase):
+
+    def test_rename_returns_generated_area(self):
+        connection = StubConnection()
+        session = StubAsyncSession(connection, persistent_plot())
+
+        result = asyncio.run(plot_controller.update_plot(
+            session, "plot-uuid", {"uuid": "owner-uuid"}, name="South field"
+        ))
+
+        self.assertEqual(result["status"], "success", result)
+        self.assertEqual(result["data"]["name"], "South field")
+        self.assertEqual(result["data"]["area_sqm"], STORED_AREA)
+        self.assertIn("RETURNING plots.area_sqm", connection.statements[-1])
+
+    def test_boundary_update_returns_generated_area(self):
+        connection = StubConnection()
+        session = StubAsyncSession(connection, persistent_plot(), boundary_area=STORED_AREA)
+
+        result = asyncio.run(plot_controller.update_plot(
+            session, "plot-uuid", {"uuid": "owner-uuid"},
+            boundary_geojson={"type": "Polygon", "coordinates": [[[0, 0], [1, 0], [1, 1], [0, 0]]]}
+        ))
+
+        self.assertEqual(result["status"], "success", result)
+        self.assertEqual(result["data"]["area_sqm"], STORED_AREA)
+
+
+class AggregateResult:
+    def __init__(self, row):
+        self.row = row
+
+    def scalar_one_or_none(self):
+        return self.row
+
+    def first(self):
+        return self.row
+
+
+class RecordingSession:
+    """Returns a canned aggregate row and records each statement's parameters."""
+
+    def __init__(self, row):
+        self.row = row
+        self.params = []
+
+    async def execute(self, statement, params=None, **kwargs):
+        self.params.append(statement.compile().params)
+        return AggregateResult(self.row)
+
+
+def stats_group(user_id):
+    """The group the owner's plot writes clear via invalidate_patterns(owner, ["stats:*"])"""
+    return GROUP_PREFIX + gen_user_key(user_id, "stats")
+
+
+@mock.patch.object(grouped_cached, "get_from_cache", mock.AsyncMock(return_value=None))
+class PlotAggregateOwnershipTest(unittest.TestCase):
+
+    def setUp(self):
+        patcher = mock.patch.object(grouped_cached, "set_in_cache", mock.AsyncMock())
+        self.set_in_cache = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_count_is_scoped_to_owner_and_cached_under_owner_stats(self):
+        session = RecordingSession(7)
+
+        result = asyncio.run(plot_controller.count_plots_by_farm(session, "owner-uuid", "farm-uuid"))
+
+        self.assertEqual(result["data"], {"count": 7})
+        self.assertIn("owner-uuid", session.params[0].values())
+        key = self.set_in_cache.await_args.args[0]
+        self.assertIn(stats_group("owner-uuid"), key_groups(key))
+
+    def test_area_for_unowned_farm_is_an_uncached_error(self):
+        session = RecordingSession(None)
+
+        result = asyncio.run(plot_controller.calculate_total_plot_area_by_farm(session, "other-uuid", "farm-uuid"))
+
+        self.assertEqual(result["error"], "Farm not found or access denied")
+        self.assertIn("other-uuid", session.params[0].values())
+        self.set_in_cache.assert_not_awaited()
+
+    def test_statistics_for_another_user_are_denied(self):
+        session = RecordingSession(None)
+
+        result = asyncio.run(plot_controller.get_plot_statistics(session, "requester-uuid", user_id="owner-uuid"))
+
+        self.assertEqual(result["error"], "Access denied")
+        self.assertEqual(session.params, [])
+
+    def test_farm_statistics_are_scoped_to_requester(self):
+        row = types.SimpleNamespace(total_plots=2, total_area=30.0, avg_area=15.0, min_area=10.0, max_area=20.0)
+        session = RecordingSession(row)
+
+        result = asyncio.run(plot_controller.get_plot_statistics(session, "owner-uuid", farm_id="farm-uuid"))
+
+        self.assertEqual(result["data"]["total_plots"], 2)
+        self.assertIn("owner-uuid", session.params[0].values())
+        key = self.set_in_cache.await_args.args[0]
+        self.assertIn(stats_group("owner-uuid"), key_groups(key))
+
+
+if __name__ == "__main__":
+    unittest.main()